@@ -0,0 +1,71 @@
+"""Exact-match disk cache for structured chain outputs.
+
+LLM inference dominates tool latency, and agent loops re-issue
+byte-identical prompts when an issue or PR has not changed between
+passes. Outputs are stored as the spec's JSON under a key derived from
+the chain name, model, and prompt, so a repeat invocation becomes a
+file read instead of a multi-second API call. Disable with
+LLM_CACHE_ENABLED=0.
+"""
+
+import hashlib
+import logging
+from pathlib import Path
+
+from ai_army.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(".ai_army_cache") / "llm"
+
+# Entries have no TTL, so a long-running daemon needs a size bound; oldest
+# entries go first once the directory crosses the cap.
+MAX_CACHE_ENTRIES = 512
+
+
+def _cache_path(chain_name: str, model: str, prompt: str, version: str) -> Path:
+    digest = hashlib.sha256(f"{chain_name}\x00{model}\x00{version}\x00{prompt}".encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def _evict_if_needed() -> None:
+    """Drop the oldest entries once the cache exceeds MAX_CACHE_ENTRIES."""
+    try:
+        entries = sorted(CACHE_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[: max(len(entries) - MAX_CACHE_ENTRIES, 0)]:
+            stale.unlink(missing_ok=True)
+    except OSError as exc:
+        logger.debug("llm_cache: eviction failed: %s", exc)
+
+
+def invoke_cached(chain_name: str, model: str, chain, prompt: str, schema, version: str = ""):
+    """Invoke a structured chain, serving byte-identical prompts from disk.
+
+    version should change whenever the underlying object does (PR head SHA,
+    issue updated_at) so a stale entry cannot be replayed against new
+    content whose prompt happens to be byte-identical. Cache misses and any
+    cache IO/parse problem fall through to a real chain.invoke; non-Pydantic
+    outputs (e.g. test doubles) are returned uncached.
+    """
+    if not settings.llm_cache_enabled:
+        return chain.invoke(prompt)
+    path = _cache_path(chain_name, model, prompt, version)
+    if path.exists():
+        try:
+            spec = schema.model_validate_json(path.read_text(encoding="utf-8"))
+            logger.info("llm_cache: hit for %s (%s)", chain_name, path.name[:12])
+            return spec
+        except Exception as exc:
+            logger.debug("llm_cache: discarding unreadable entry %s: %s", path.name, exc)
+    spec = chain.invoke(prompt)
+    try:
+        payload = spec.model_dump_json()
+    except AttributeError:
+        return spec
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path.write_text(payload, encoding="utf-8")
+        _evict_if_needed()
+    except OSError as exc:
+        logger.debug("llm_cache: could not persist entry for %s: %s", chain_name, exc)
+    return spec
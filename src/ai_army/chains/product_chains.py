@@ -11,6 +11,8 @@ logger = logging.getLogger(__name__)
 
 LLM_TEMPERATURE = 0.3
 
+_CHAIN_CACHE: dict[tuple[str, str], object] = {}
+
 
 def _get_llm() -> ChatAnthropic:
     """Get ChatAnthropic LLM. Model from config (LLM_MODEL env or settings)."""
@@ -20,15 +22,22 @@ def _get_llm() -> ChatAnthropic:
     )
 
 
+def _cached_chain(name: str, schema):
+    """Build the structured-output chain once per (chain, model); chains are stateless."""
+    key = (name, get_llm_model())
+    chain = _CHAIN_CACHE.get(key)
+    if chain is None:
+        logger.debug("%s: building chain with model=%s", name, key[1])
+        chain = _get_llm().with_structured_output(schema)
+        _CHAIN_CACHE[key] = chain
+    return chain
+
+
 def create_issue_chain():
     """Return a runnable that produces IssueSpec from a free-form description."""
-    logger.debug("create_issue_chain: building chain with model=%s", get_llm_model())
-    llm = _get_llm()
-    return llm.with_structured_output(IssueSpec)
+    return _cached_chain("create_issue_chain", IssueSpec)
 
 
 def enrich_issue_chain():
     """Return a runnable that produces EnrichIssueSpec from issue context."""
-    logger.debug("enrich_issue_chain: building chain with model=%s", get_llm_model())
-    llm = _get_llm()
-    return llm.with_structured_output(EnrichIssueSpec)
+    return _cached_chain("enrich_issue_chain", EnrichIssueSpec)
@@ -11,6 +11,8 @@ logger = logging.getLogger(__name__)
 
 LLM_TEMPERATURE = 0.3
 
+_CHAIN_CACHE: dict[str, object] = {}
+
 
 def _get_llm() -> ChatAnthropic:
     """Get ChatAnthropic LLM. Model from config (LLM_MODEL env or settings)."""
@@ -22,6 +24,10 @@ def _get_llm() -> ChatAnthropic:
 
 def breakdown_chain():
     """Return a runnable that produces BreakdownSpec from parent issue context."""
-    logger.debug("breakdown_chain: building chain with model=%s", get_llm_model())
-    llm = _get_llm()
-    return llm.with_structured_output(BreakdownSpec)
+    model = get_llm_model()
+    chain = _CHAIN_CACHE.get(model)
+    if chain is None:
+        logger.debug("breakdown_chain: building chain with model=%s", model)
+        chain = _get_llm().with_structured_output(BreakdownSpec)
+        _CHAIN_CACHE[model] = chain
+    return chain
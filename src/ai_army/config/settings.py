@@ -34,12 +34,18 @@ class Settings(BaseSettings):
     # claude-3-5-haiku-20241022 deprecated 2026-02-19. Use claude-haiku-4-5.
     anthropic_llm_model: str = "claude-haiku-4-5"
 
+    # Reuse structured chain outputs for byte-identical prompts (.ai_army_cache).
+    # Saves repeat LLM calls when agents re-enrich/re-review unchanged inputs.
+    llm_cache_enabled: bool = True
+
     # Single repo (backward compat)
     github_target_token: str = ""
     github_target_repo: str = ""
 
     # Multi-repo: GITHUB_REPO_1, GITHUB_TOKEN_1, GITHUB_REPO_2, GITHUB_TOKEN_2, ...
     # Loaded dynamically - see get_github_repos()
+    # A token var may hold several comma-separated tokens; requests rotate to
+    # whichever has the most remaining rate budget (see _pick_token).
 
     # Local clone path for git operations (override when dev crew clones automatically).
     local_repo_path: str = ""
@@ -50,6 +56,11 @@ class Settings(BaseSettings):
     # RAG embedding model for codebase search (dev agents). sentence-transformers model ID.
     rag_embedding_model: str = "all-MiniLM-L6-v2"
 
+    # Embedding precision: "float32" (default) or "int8" (quantized, ~4x smaller
+    # index and faster ANN search with minor recall loss). Index and query must
+    # match; snapshots are rebuilt fully each refresh so flipping this is safe.
+    rag_embedding_precision: str = "float32"
+
     # Force grep fallback for codebase search (skip RAG indexing). Use when RAG encoding is too slow (e.g. CPU).
     # Set RAG_USE_GREP_FALLBACK=1 in production to avoid 20+ min blocks.
     rag_use_grep_fallback: bool = False
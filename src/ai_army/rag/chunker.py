@@ -26,10 +26,21 @@ SKIP_DIRS = frozenset(
 SKIP_EXTENSIONS = frozenset(
     {".min.js", ".min.css", ".pyc", ".png", ".jpg", ".jpeg", ".gif", ".ico", ".woff", ".woff2"}
 )
-# Regex for logical boundaries (Python, JS/TS)
+# Single compiled union over SKIP_DIRS: should_index_path runs once per file
+# across the whole repo, and one C-level search beats a Python loop over
+# path.parts for every call.
+_SKIP_DIR_PATTERN = re.compile(
+    r"(?:^|/)(?:" + "|".join(map(re.escape, sorted(SKIP_DIRS))) + r")(?:/|$)"
+)
+# Regex for logical boundaries (Python, JS/TS). MULTILINE so one finditer
+# pass over the whole file replaces a per-line Python loop; the indent class
+# excludes newlines so a match can never start on an earlier blank line.
 BOUNDARY_PATTERN = re.compile(
-    r"^(\s*)(def |class |async def |function |export function |export default function )"
+    r"^([ \t]*)(def |class |async def |function |export function |export default function )",
+    re.MULTILINE,
 )
+# Symbol-name extractor, compiled once instead of per boundary
+_SYMBOL_PATTERN = re.compile(r"(def|class|function)\s+(\w+)")
 
 
 @dataclass
@@ -45,7 +56,7 @@ class Chunk:
 def should_index_path(file_path: Path) -> bool:
     """Return True if the file should be indexed."""
     path_str = file_path.as_posix()
-    if any(part in SKIP_DIRS for part in file_path.parts):
+    if _SKIP_DIR_PATTERN.search(path_str):
         return False
     if file_path.suffix.lower() in SKIP_EXTENSIONS:
         return False
@@ -59,19 +70,27 @@ def chunk_file(relative_path: str, content: str) -> list[Chunk]:
 
     Returns list of Chunk with text, start_line, end_line, symbol_name.
     """
-    lines = content.splitlines()
+    # Split on "\n" only — the boundary pass below derives line numbers by
+    # counting "\n", and splitlines() would also break on \f, \r, \x85 etc.
+    # and drift out of step with those counts.
+    lines = content.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()  # trailing newline, not an extra line
     if not lines:
         return []
 
-    # Find boundaries
+    # Find boundaries in one pass over the whole file; line numbers come from
+    # incremental newline counts (C level) rather than iterating lines.
     boundaries: list[tuple[int, str | None]] = [(0, None)]
-    for i, line in enumerate(lines):
-        m = BOUNDARY_PATTERN.match(line)
-        if m:
-            symbol = m.group(2).strip()
-            name_match = re.search(r"(def|class|function)\s+(\w+)", line)
-            symbol_name = name_match.group(2) if name_match else symbol
-            boundaries.append((i, symbol_name))
+    pos = 0
+    line_no = 0
+    for m in BOUNDARY_PATTERN.finditer(content):
+        line_no += content.count("\n", pos, m.start())
+        pos = m.start()
+        symbol = m.group(2).strip()
+        name_match = _SYMBOL_PATTERN.search(lines[line_no])
+        symbol_name = name_match.group(2) if name_match else symbol
+        boundaries.append((line_no, symbol_name))
 
     chunks: list[Chunk] = []
     for idx, (start, symbol_name) in enumerate(boundaries):
@@ -29,6 +29,7 @@ from ai_army.rag.runtime_state import (
     repo_slug,
     save_runtime_state,
     snapshot_dir_for_version,
+    snapshot_head_path,
     snapshot_meta_path,
     staging_snapshot_dir,
     validate_runtime_state,
@@ -51,6 +52,12 @@ def _get_model() -> SentenceTransformer:
     return _MODEL
 
 
+def _encode_kwargs() -> dict:
+    """Extra encode() kwargs; int8 quantization when configured (ST >= 2.7)."""
+    precision = settings.rag_embedding_precision
+    return {"precision": precision} if precision != "float32" else {}
+
+
 def _language_for_path(path: Path) -> str:
     suffix = path.suffix.lower().lstrip(".")
     return suffix or "text"
@@ -69,7 +76,7 @@ def _flush_batch(
 ) -> int:
     if not texts:
         return 0
-    embeddings = model.encode(texts, show_progress_bar=False)
+    embeddings = model.encode(texts, show_progress_bar=False, **_encode_kwargs())
     collection.add(ids=ids, embeddings=embeddings.tolist(), documents=texts, metadatas=metadatas)
     size = len(texts)
     texts.clear()
@@ -164,6 +171,7 @@ def _build_index_inner(repo_path: Path, batch_size: int) -> Path:
                 "build_finished_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
             }
             snapshot_meta_path(staging_dir).write_text(json.dumps(meta, indent=2))
+            snapshot_head_path(staging_dir).write_bytes(head.encode("ascii"))
 
             count = collection.count()
             if count != chunks_indexed:
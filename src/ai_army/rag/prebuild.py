@@ -13,7 +13,7 @@ from ai_army.rag.runtime_state import (
     repo_key_for_config,
     validate_runtime_state,
 )
-from ai_army.repo_clone import ensure_repo_cloned
+from ai_army.repo_clone import ensure_repos_cloned
 
 logger = logging.getLogger(__name__)
 
@@ -24,13 +24,17 @@ def refresh_indexes() -> None:
     if not repos:
         return
 
+    # Clone/update all repos up front so network I/O overlaps across repos
+    clone_paths = ensure_repos_cloned(repos)
+
     for repo_config in repos:
         t0 = time.monotonic()
         logger.info("%s refresh started for %s", RAG_LOG, repo_config.repo)
         clone_path = None
         try:
-            clone_path = ensure_repo_cloned(repo_config)
+            clone_path = clone_paths.get(repo_config.repo)
             if not clone_path:
+                mark_build_failed(repo_key_for_config(repo_config), "clone failed")
                 logger.warning("%s refresh skipped for %s (clone failed)", RAG_LOG, repo_config.repo)
                 continue
 
@@ -1,6 +1,8 @@
 """LangChain BaseRetriever wrapping codebase semantic search."""
 
+import asyncio
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +13,9 @@ from ai_army.rag.search import search
 
 logger = logging.getLogger(__name__)
 
+# Bound concurrent blocking searches offloaded from the event loop.
+_SEARCH_SEMAPHORE = asyncio.Semaphore(os.cpu_count() or 4)
+
 
 class CodebaseRetriever(BaseRetriever):
     """LangChain retriever that wraps rag.search() for codebase semantic search.
@@ -51,3 +56,12 @@ class CodebaseRetriever(BaseRetriever):
                 )
             )
         return docs
+
+    async def _aget_relevant_documents(self, query: str, **kwargs: Any) -> list[Document]:
+        """Retrieve documents without blocking the event loop.
+
+        Offloads the synchronous search to a worker thread so concurrent
+        retrievals (including against different repos) can overlap.
+        """
+        async with _SEARCH_SEMAPHORE:
+            return await asyncio.to_thread(self._get_relevant_documents, query, **kwargs)
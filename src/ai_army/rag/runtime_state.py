@@ -106,6 +106,18 @@ def _parse_iso(value: str) -> datetime | None:
         return None
 
 
+try:
+    import orjson
+
+    def _read_json(path: Path) -> Any:
+        """Parse a JSON file with orjson's C parser (skips UTF-8 transcoding)."""
+        return orjson.loads(path.read_bytes())
+except ImportError:
+    def _read_json(path: Path) -> Any:
+        """Fallback JSON file parser via stdlib json."""
+        return json.loads(path.read_text())
+
+
 def _write_json_atomic(path: Path, payload: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.with_suffix(path.suffix + ".tmp")
@@ -113,12 +125,16 @@ def _write_json_atomic(path: Path, payload: dict[str, Any]) -> None:
     tmp_path.replace(path)
 
 
+# cwd never changes for this process; resolve once instead of per call
+_CWD = Path.cwd().resolve()
+
+
 def workspace_root() -> Path:
     """Shared workspace root for clones and RAG artifacts."""
     raw = settings.repo_workspace.strip()
     if raw:
         return Path(raw).expanduser().resolve()
-    return Path.cwd().resolve() / ".ai_army_workspace"
+    return _CWD / ".ai_army_workspace"
 
 
 def repo_slug(repo: str | Path) -> str:
@@ -156,6 +172,19 @@ def snapshot_meta_path(snapshot_dir: Path) -> Path:
     return snapshot_dir / ".meta.json"
 
 
+def snapshot_head_path(snapshot_dir: Path) -> Path:
+    """Fixed-size sibling of .meta.json holding only the source commit SHA."""
+    return snapshot_dir / ".meta.head"
+
+
+def read_snapshot_head(snapshot_dir: Path) -> str:
+    """Read the snapshot's source commit from the byte file; '' when absent."""
+    try:
+        return snapshot_head_path(snapshot_dir).read_bytes().strip().decode("ascii")
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+
 def build_window_opens_at() -> str:
     delay_minutes = max(settings.rag_agent_window_delay_minutes, 0)
     return (_utc_now() + timedelta(minutes=delay_minutes)).isoformat()
@@ -168,7 +197,7 @@ def load_runtime_state(repo: str | Path) -> RepoRuntimeState:
     if not path.exists():
         return RepoRuntimeState(repo_key=key)
     try:
-        payload = json.loads(path.read_text())
+        payload = _read_json(path)
         return RepoRuntimeState.from_dict(payload, repo_key=key)
     except Exception as exc:
         logger.warning("%s failed to read runtime state for %s: %s", RAG_LOG, key, exc)
@@ -187,7 +216,7 @@ def load_active_snapshot(repo: str | Path) -> dict[str, Any] | None:
     if not path.exists():
         return None
     try:
-        return json.loads(path.read_text())
+        return _read_json(path)
     except Exception as exc:
         logger.warning("%s failed to read active snapshot pointer for %s: %s", RAG_LOG, repo_slug(repo), exc)
         return None
@@ -204,8 +233,33 @@ def cleanup_staging_dir(path: Path) -> None:
         shutil.rmtree(path, ignore_errors=True)
 
 
-def current_head_commit(repo_path: Path) -> str | None:
-    """Get current HEAD commit for the local clone."""
+# HEAD rarely changes between back-to-back searches; memoize briefly to avoid
+# re-resolving it on every query.
+HEAD_CACHE_TTL_SECONDS = 2.0
+_HEAD_CACHE: dict[str, tuple[str, float]] = {}
+_PYGIT2_REPOS: dict[str, Any] = {}
+
+
+def _head_commit_in_process(repo_path: Path) -> str | None:
+    """Resolve HEAD via pygit2 (no fork/exec). Returns None when unavailable."""
+    try:
+        import pygit2
+    except ImportError:
+        return None
+    key = str(repo_path)
+    try:
+        repo = _PYGIT2_REPOS.get(key)
+        if repo is None:
+            repo = pygit2.Repository(key)
+            _PYGIT2_REPOS[key] = repo
+        return str(repo.head.target)
+    except Exception:
+        _PYGIT2_REPOS.pop(key, None)
+        return None
+
+
+def _head_commit_subprocess(repo_path: Path) -> str | None:
+    """Fallback: resolve HEAD by forking git."""
     try:
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"],
@@ -219,6 +273,25 @@ def current_head_commit(repo_path: Path) -> str | None:
         return None
 
 
+def current_head_commit(repo_path: Path) -> str | None:
+    """Get current HEAD commit for the local clone.
+
+    Uses pygit2 in-process when available (microseconds vs a subprocess fork),
+    falling back to git rev-parse. Results are memoized for a short TTL.
+    """
+    key = str(repo_path)
+    cached = _HEAD_CACHE.get(key)
+    now = time.monotonic()
+    if cached and now < cached[1]:
+        return cached[0]
+    head = _head_commit_in_process(repo_path)
+    if head is None:
+        head = _head_commit_subprocess(repo_path)
+    if head:
+        _HEAD_CACHE[key] = (head, now + HEAD_CACHE_TTL_SECONDS)
+    return head
+
+
 def git_repo_usable(repo_path: Path) -> bool:
     """Check that a local clone is readable and git-aware."""
     if not (repo_path / ".git").exists():
@@ -354,6 +427,8 @@ def validate_runtime_state(
         published_at = active_snapshot.get("published_at", "")
         snapshot_dir = Path(active_snapshot_dir)
         if snapshot_dir.exists():
+            # Prefer the fixed-size head file over the JSON field for the compare
+            source_commit = read_snapshot_head(snapshot_dir) or source_commit
             if snapshot_is_fresh(repo_path, source_commit):
                 retrieval_mode = "semantic_fresh"
                 index_state = "index_published_fresh"
@@ -6,6 +6,7 @@ import subprocess
 import time
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 from ai_army.config.settings import settings
 from ai_army.rag.runtime_state import (
@@ -19,6 +20,22 @@ _RAG_AVAILABLE: bool | None = None
 _RAG_STATUS_LOGGED: bool = False
 _QUERY_MODEL = None
 
+# Freshness decision barely changes between back-to-back queries; cache the
+# validated state briefly so query bursts skip the disk reads + git checks.
+STATE_CACHE_TTL_SECONDS = 5.0
+_STATE_CACHE: dict[Path, tuple] = {}
+
+
+def _validated_state(repo_path: Path):
+    """Validate runtime state with a short in-process TTL cache per repo."""
+    now = time.monotonic()
+    cached = _STATE_CACHE.get(repo_path)
+    if cached and now < cached[1]:
+        return cached[0]
+    state = validate_runtime_state(repo_path)
+    _STATE_CACHE[repo_path] = (state, now + STATE_CACHE_TTL_SECONDS)
+    return state
+
 
 def _rag_available() -> bool:
     """Check if RAG deps (sentence_transformers, chromadb) are importable."""
@@ -106,6 +123,45 @@ MAX_SNIPPET_LINES = 30
 QUERY_COLLECTION_NAME = COLLECTION_NAME
 
 
+# Published snapshots are immutable, so collections can be cached per snapshot
+# dir; this avoids re-opening SQLite and re-loading the HNSW index per query.
+_COLLECTION_CACHE: dict[str, Any] = {}
+
+
+def _get_collection(snapshot_dir: Path):
+    """Open (or reuse) the Chroma collection for a published snapshot."""
+    import chromadb
+
+    key = str(snapshot_dir)
+    collection = _COLLECTION_CACHE.get(key)
+    if collection is None:
+        client = chromadb.PersistentClient(path=key)
+        collection = client.get_or_create_collection(
+            QUERY_COLLECTION_NAME, metadata={"hnsw:space": "cosine"}
+        )
+        # A new snapshot only replaces this repo's old one (snapshots of one
+        # repo share a parent dir); other repos' collections stay warm since
+        # the scheduler alternates queries across repos.
+        parent = snapshot_dir.parent
+        for stale in [k for k in _COLLECTION_CACHE if Path(k).parent == parent]:
+            del _COLLECTION_CACHE[stale]
+        _COLLECTION_CACHE[key] = collection
+    return collection
+
+
+def _truncate_snippet(snippet: str, max_lines: int) -> str:
+    """Truncate to max_lines with a bounded newline scan (no full splitlines)."""
+    idx = -1
+    for _ in range(max_lines):
+        next_idx = snippet.find("\n", idx + 1)
+        if next_idx == -1:
+            return snippet
+        idx = next_idx
+    if idx == len(snippet) - 1:  # Nth newline is trailing; nothing truncated
+        return snippet
+    return snippet[:idx] + "\n..."
+
+
 def _get_query_model():
     """Cache the query embedding model across searches."""
     global _QUERY_MODEL
@@ -129,23 +185,21 @@ def query_codebase(repo_path: Path | str, query: str, top_k: int = 8) -> SearchR
         logger.warning("%s %s is not a git repo", RAG_LOG, repo_path)
         return SearchResponse(results=[], retrieval_mode="invalid_repo")
 
-    state = validate_runtime_state(repo_path)
+    state = _validated_state(repo_path)
     if state.retrieval_mode.startswith("semantic") and _rag_available():
         active_snapshot = load_active_snapshot(repo_path)
         snapshot_dir = Path(active_snapshot.get("snapshot_dir", "")) if active_snapshot else None
         if snapshot_dir and snapshot_dir.exists():
             try:
-                import chromadb
-
-                client = chromadb.PersistentClient(path=str(snapshot_dir))
-                collection = client.get_or_create_collection(
-                    QUERY_COLLECTION_NAME, metadata={"hnsw:space": "cosine"}
-                )
+                collection = _get_collection(snapshot_dir)
                 count = collection.count()
                 if count > 0:
                     logger.debug("%s querying snapshot %s (count=%d, top_k=%d)", RAG_LOG, state.snapshot_version, count, top_k)
                     model = _get_query_model()
-                    query_embedding = model.encode([query], show_progress_bar=False)
+                    # Precision must match the index build (see indexer._encode_kwargs)
+                    precision = settings.rag_embedding_precision
+                    encode_kwargs = {"precision": precision} if precision != "float32" else {}
+                    query_embedding = model.encode([query], show_progress_bar=False, **encode_kwargs)
                     results = collection.query(
                         query_embeddings=query_embedding.tolist(),
                         n_results=min(top_k, count),
@@ -156,10 +210,7 @@ def query_codebase(repo_path: Path | str, query: str, top_k: int = 8) -> SearchR
                         for meta_list, doc_list in zip(results["metadatas"][0], results["documents"][0]):
                             if not meta_list or not doc_list:
                                 continue
-                            snippet = doc_list
-                            lines = snippet.splitlines()
-                            if len(lines) > MAX_SNIPPET_LINES:
-                                snippet = "\n".join(lines[:MAX_SNIPPET_LINES]) + "\n..."
+                            snippet = _truncate_snippet(doc_list, MAX_SNIPPET_LINES)
                             out.append(
                                 {
                                     "file_path": meta_list.get("file_path", ""),
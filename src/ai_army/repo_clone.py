@@ -3,23 +3,30 @@
 import logging
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ai_army.config.settings import get_github_repos, settings
 from ai_army.config.settings import GitHubRepoConfig
+# From api_cache, not git_branch_tools: this module is imported by the
+# scheduler and rag.prebuild, which must stay off the crewai import path.
+from ai_army.tools.api_cache import invalidate_base_ref_cache
 
 logger = logging.getLogger(__name__)
 
 # If index.lock is older than this (seconds), treat as stale from crashed process
 GIT_INDEX_LOCK_STALE_SECONDS = 120
 
+# cwd never changes for this process; resolve once instead of per call
+_CWD = Path.cwd().resolve()
+
 
 def _workspace_root() -> Path:
     """Directory where we clone target repos. Default: .ai_army_workspace in cwd."""
     raw = settings.repo_workspace.strip()
     if raw:
         return Path(raw).expanduser().resolve()
-    return Path.cwd().resolve() / ".ai_army_workspace"
+    return _CWD / ".ai_army_workspace"
 
 
 def _clone_url_with_auth(repo_config: GitHubRepoConfig) -> str:
@@ -79,6 +86,9 @@ def ensure_repo_cloned(repo_config: GitHubRepoConfig | None = None) -> Path | No
         if r.returncode != 0:
             logger.warning("git fetch failed in %s: %s", clone_path, r.stderr)
             return clone_path
+        # The fetch (and the checkout below) may create a local main where
+        # only origin/main existed; cached base-ref answers are now stale.
+        invalidate_base_ref_cache()
         # Reset to origin's default branch (main or master)
         default_ref = "origin/main"
         ref_check = subprocess.run(
@@ -125,3 +135,28 @@ def ensure_repo_cloned(repo_config: GitHubRepoConfig | None = None) -> Path | No
         return None
     logger.info("ensure_repo_cloned: successfully cloned %s to %s", repo_config.repo, clone_path)
     return clone_path
+
+
+def ensure_repos_cloned(
+    repo_configs: list[GitHubRepoConfig],
+) -> dict[str, Path | None]:
+    """Clone/update several repos concurrently; return repo -> clone path.
+
+    Each clone/fetch is network-bound, so running them in a thread pool
+    overlaps the I/O instead of serializing 60-120s subprocess waits.
+    """
+    if not repo_configs:
+        return {}
+
+    def _clone_one(cfg: GitHubRepoConfig) -> Path | None:
+        # A hung fetch or clone (TimeoutExpired) on one repo must not abort
+        # the whole batch; callers treat None as "clone failed" per repo.
+        try:
+            return ensure_repo_cloned(cfg)
+        except Exception as e:
+            logger.warning("ensure_repos_cloned: clone/update failed for %s: %s", cfg.repo, e)
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(8, len(repo_configs))) as executor:
+        paths = list(executor.map(_clone_one, repo_configs))
+    return {cfg.repo: path for cfg, path in zip(repo_configs, paths)}
@@ -8,10 +8,6 @@ import logging
 import time
 
 from ai_army.config import get_github_repos
-from ai_army.crews.dev_crew import DevCrew
-from ai_army.crews.merge_crew import MergeCrew
-from ai_army.crews.product_crew import ProductCrew
-from ai_army.crews.team_lead_crew import TeamLeadCrew
 from ai_army.dev_context import build_workspace_context, list_in_progress_branch_infos
 from ai_army.memory.context_store import get_context_store
 from ai_army.rag.prebuild import refresh_indexes
@@ -20,7 +16,6 @@ from ai_army.repo_clone import ensure_repo_cloned
 from ai_army.scheduler.token_check import invalidate_token_cache, run_if_tokens_available
 from ai_army.tools.github_helpers import (
     count_backlog_promotable,
-    count_issues_for_dev,
     count_issues_ready_for_breakdown,
     count_prioritized_needing_enrichment,
     find_conflicting_agent_prs,
@@ -135,6 +130,9 @@ def run_product_crew_job() -> None:
         return
 
     def _run() -> None:
+        # Lazy import: crewai stack is heavy; skip it when jobs early-exit
+        from ai_army.crews.product_crew import ProductCrew
+
         t0 = time.monotonic()
         store = get_context_store()
         store.load()
@@ -180,6 +178,9 @@ def run_team_lead_crew_job() -> None:
         return
 
     def _run() -> None:
+        # Lazy import: crewai stack is heavy; skip it when jobs early-exit
+        from ai_army.crews.team_lead_crew import TeamLeadCrew
+
         t0 = time.monotonic()
         store = get_context_store()
         store.load()
@@ -211,7 +212,10 @@ def run_dev_crew_job(agent_type: str) -> None:
         return
 
     conflict_prs = find_conflicting_agent_prs(repo_config, agent_type)
-    count = count_issues_for_dev(repo_config, agent_type)
+    # Single fetch reused below for the in-progress count (avoids a second
+    # paginated GitHub listing inside _run)
+    dev_issues = list_issues_for_dev(repo_config, agent_type)
+    count = len(dev_issues)
     if count == 0 and not conflict_prs:
         logger.info("[%s] Skipping - no available issues and no conflicted PRs", TAG)
         _log_next_run(TAG)
@@ -224,14 +228,16 @@ def run_dev_crew_job(agent_type: str) -> None:
         return
 
     def _run() -> None:
+        # Lazy import: crewai stack is heavy; skip it when jobs early-exit
+        from ai_army.crews.dev_crew import DevCrew
+
         t0 = time.monotonic()
         try:
             with workspace_lock(clone_path):
                 store = get_context_store()
                 store.load()
                 in_progress_count = sum(
-                    1 for _, _, is_in_progress in list_issues_for_dev(repo_config, agent_type)
-                    if is_in_progress
+                    1 for _, _, is_in_progress in dev_issues if is_in_progress
                 )
                 crew_context = (
                     store.get_summary(exclude=None)
@@ -426,6 +432,9 @@ def run_merge_crew_job() -> None:
     logger.info("[%s] %d open PR(s) to process", TAG, len(open_prs))
 
     def _run() -> None:
+        # Lazy import: crewai stack is heavy; skip it when jobs early-exit
+        from ai_army.crews.merge_crew import MergeCrew
+
         t0 = time.monotonic()
         try:
             with workspace_lock(clone_path):
@@ -8,9 +8,11 @@ after RAG finishes (~:36) and agent window opens (~:46). Big buffers for reliabi
 """
 
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
 from functools import partial
 
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from ai_army.config import get_github_repos
@@ -25,7 +27,9 @@ from ai_army.scheduler.jobs import (
     set_scheduler,
 )
 from ai_army.scheduler.token_check import has_available_tokens
-from ai_army.tools.github_tools import check_github_connection_and_log
+# Import from the crewai-free helpers module: pulling this via github_tools
+# would defeat the lazy tools package and pay the crewai import at startup.
+from ai_army.tools.github_helpers import check_github_connection_and_log
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +54,19 @@ def _refresh_hour_expr(hour_offset: int = 0) -> str:
     return ",".join(hours) if hours else str(hour_offset % 24)
 
 
+def _warm_rag_caches() -> None:
+    """Pre-load the query embedding model so the first search skips the cold start."""
+    try:
+        from ai_army.rag.search import _get_query_model, _rag_available
+
+        if getattr(settings, "rag_use_grep_fallback", False) or not _rag_available():
+            return
+        _get_query_model()
+        logger.info("RAG warm-up done | query model ready")
+    except Exception as e:
+        logger.warning("RAG warm-up failed (first search will load the model): %s", e)
+
+
 def _check_startup() -> bool:
     """Verify API, GitHub, and repos on startup. Returns True if ready."""
     logger.info("Scheduler startup check...")
@@ -68,6 +85,8 @@ def _check_startup() -> bool:
         logger.info("GitHub: able to connect and get repos | %s", ", ".join(ok))
     if failed:
         logger.warning("GitHub: failed to connect to repo(s) | %s", ", ".join(failed))
+    # Warm the embedding model in the background so the first real query is hot
+    threading.Thread(target=_warm_rag_caches, name="rag-warmup", daemon=True).start()
     logger.info("Startup OK | %d repo(s) configured", len(repos))
     return True
 
@@ -78,7 +97,12 @@ def create_scheduler() -> BackgroundScheduler:
     Crews run at :50-:59 to align with RAG finish (~:36) + agent window (~:46).
     RAG runs every 2h by default for big buffers.
     """
-    scheduler = BackgroundScheduler()
+    # Bounded pool + max_instances=1 so long Claude invocations can't stack
+    # duplicate runs or spawn unbounded threads across the six cron jobs.
+    scheduler = BackgroundScheduler(
+        executors={"default": ThreadPoolExecutor(max_workers=2)},
+        job_defaults={"max_instances": 1, "coalesce": True, "misfire_grace_time": 300},
+    )
     base = settings.rag_crew_base_minute
     product_minute = base
     team_lead_minute = base + 2
@@ -99,6 +123,7 @@ def create_scheduler() -> BackgroundScheduler:
         minute=str(refresh_minute),
         hour=_refresh_hour_expr(refresh_hour_offset),
         id="rag_refresh",
+        replace_existing=True,
     )
     scheduler.add_job(
         run_product_crew_job,
@@ -106,6 +131,7 @@ def create_scheduler() -> BackgroundScheduler:
         minute=str(product_minute),
         hour=crew_hour,
         id="product_crew",
+        replace_existing=True,
     )
     scheduler.add_job(
         run_team_lead_crew_job,
@@ -113,6 +139,7 @@ def create_scheduler() -> BackgroundScheduler:
         minute=str(team_lead_minute),
         hour=crew_hour,
         id="team_lead_crew",
+        replace_existing=True,
     )
     scheduler.add_job(
         partial(run_dev_crew_job, "frontend"),
@@ -120,6 +147,7 @@ def create_scheduler() -> BackgroundScheduler:
         minute=str(frontend_minute),
         hour=crew_hour,
         id="dev_crew_frontend",
+        replace_existing=True,
     )
     scheduler.add_job(
         partial(run_dev_crew_job, "backend"),
@@ -127,6 +155,7 @@ def create_scheduler() -> BackgroundScheduler:
         minute=str(backend_minute),
         hour=crew_hour,
         id="dev_crew_backend",
+        replace_existing=True,
     )
     scheduler.add_job(
         partial(run_dev_crew_job, "fullstack"),
@@ -134,6 +163,7 @@ def create_scheduler() -> BackgroundScheduler:
         minute=str(fullstack_minute),
         hour=crew_hour,
         id="dev_crew_fullstack",
+        replace_existing=True,
     )
     scheduler.add_job(
         run_conflict_check_job,
@@ -141,6 +171,7 @@ def create_scheduler() -> BackgroundScheduler:
         minute=str(conflict_check_minute),
         hour=crew_hour,
         id="conflict_check",
+        replace_existing=True,
     )
     scheduler.add_job(
         run_merge_crew_job,
@@ -148,6 +179,7 @@ def create_scheduler() -> BackgroundScheduler:
         minute=str(merge_minute),
         hour=crew_hour,
         id="merge_crew",
+        replace_existing=True,
     )
     # QA disabled - automation infra to be added later
     # Startup: RAG first; crews 100 min later (RAG ~96 min + buffer)
@@ -158,48 +190,56 @@ def create_scheduler() -> BackgroundScheduler:
         trigger="date",
         run_date=now,
         id="rag_refresh_startup",
+        replace_existing=True,
     )
     scheduler.add_job(
         run_product_crew_job,
         trigger="date",
         run_date=now + timedelta(minutes=startup_delay),
         id="product_crew_startup",
+        replace_existing=True,
     )
     scheduler.add_job(
         run_team_lead_crew_job,
         trigger="date",
         run_date=now + timedelta(minutes=startup_delay + 2),
         id="team_lead_crew_startup",
+        replace_existing=True,
     )
     scheduler.add_job(
         partial(run_dev_crew_job, "frontend"),
         trigger="date",
         run_date=now + timedelta(minutes=startup_delay + 4),
         id="dev_crew_frontend_startup",
+        replace_existing=True,
     )
     scheduler.add_job(
         partial(run_dev_crew_job, "backend"),
         trigger="date",
         run_date=now + timedelta(minutes=startup_delay + 6),
         id="dev_crew_backend_startup",
+        replace_existing=True,
     )
     scheduler.add_job(
         partial(run_dev_crew_job, "fullstack"),
         trigger="date",
         run_date=now + timedelta(minutes=startup_delay + 8),
         id="dev_crew_fullstack_startup",
+        replace_existing=True,
     )
     scheduler.add_job(
         run_conflict_check_job,
         trigger="date",
         run_date=now + timedelta(minutes=startup_delay + 9),
         id="conflict_check_startup",
+        replace_existing=True,
     )
     scheduler.add_job(
         run_merge_crew_job,
         trigger="date",
         run_date=now + timedelta(minutes=startup_delay + 9),
         id="merge_crew_startup",
+        replace_existing=True,
     )
     set_scheduler(scheduler)
     return scheduler
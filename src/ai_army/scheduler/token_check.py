@@ -6,7 +6,7 @@ Caches result for pipeline duration to avoid redundant API calls.
 """
 
 import logging
-from datetime import datetime, timedelta, timezone
+import time
 from typing import Callable
 
 from ai_army.config.llm_config import get_llm_model
@@ -17,7 +17,18 @@ RATE_LIMIT_STATUS = 429
 CACHE_TTL_MINUTES = 55
 
 _cached_tokens_available: bool | None = None
-_cache_valid_until: datetime | None = None
+_cache_valid_until: float | None = None
+_client = None
+
+
+def _get_client():
+    """Lazily build and reuse one Anthropic client (keeps the HTTP pool warm)."""
+    global _client
+    if _client is None:
+        import anthropic
+
+        _client = anthropic.Anthropic()
+    return _client
 
 
 def invalidate_token_cache() -> None:
@@ -36,16 +47,14 @@ def has_available_tokens() -> bool:
     Returns False if we get 429 or auth errors.
     """
     global _cached_tokens_available, _cache_valid_until
-    now = datetime.now(timezone.utc)
+    now = time.monotonic()
     if _cache_valid_until is not None and now < _cache_valid_until and _cached_tokens_available is not None:
-        logger.debug("Token check: using cached result (valid until %s)", _cache_valid_until.isoformat())
+        logger.debug("Token check: using cached result (%.0fs left)", _cache_valid_until - now)
         return _cached_tokens_available
 
     logger.info("Token check: fresh API call (cache invalid or expired)")
     try:
-        import anthropic
-
-        client = anthropic.Anthropic()
+        client = _get_client()
         model = get_llm_model()
         # Prefer count_tokens - zero cost, verifies API is reachable
         if hasattr(client.messages, "count_tokens"):
@@ -61,7 +70,7 @@ def has_available_tokens() -> bool:
                 messages=[{"role": "user", "content": "Hi"}],
             )
         _cached_tokens_available = True
-        _cache_valid_until = now + timedelta(minutes=CACHE_TTL_MINUTES)
+        _cache_valid_until = now + CACHE_TTL_MINUTES * 60
         return True
     except Exception as e:
         err_name = type(e).__name__
@@ -73,7 +82,7 @@ def has_available_tokens() -> bool:
         else:
             logger.warning("API check failed - skipping run: %s", e)
         _cached_tokens_available = False
-        _cache_valid_until = now + timedelta(minutes=CACHE_TTL_MINUTES)
+        _cache_valid_until = now + CACHE_TTL_MINUTES * 60
         return False
 
 
@@ -5,74 +5,59 @@ BreakdownAndCreateSubIssuesTool, CreatePullRequest, ListPullRequests, ReviewPull
 Git: CreateLocalBranch, GitCommit, GitPush.
 Repo: RepoStructure, ListDir, ReadFile, WriteFile.
 Search: SearchCodebaseTool (RAG semantic search, used by Dev).
+
+Tool classes are loaded lazily (PEP 562): importing ai_army.tools is cheap,
+and heavy transitive deps (crewai, the RAG stack behind SearchCodebaseTool)
+are only paid when the attribute is first accessed.
 """
 
+import importlib
+
 from ai_army.config.settings import GitHubRepoConfig
-from ai_army.tools.github_tools import (
-    BreakdownAndCreateSubIssuesTool,
-    CreateBranchTool,
-    CreateIssueTool,
-    CreatePullRequestTool,
-    CreateStructuredIssueTool,
-    EnrichIssueTool,
-    GetPullRequestDetailsTool,
-    ListClosedIssuesTool,
-    ListOpenIssuesTool,
-    ListPullRequestsTool,
-    MergePullRequestTool,
-    ReviewPullRequestTool,
-    UpdateIssueTool,
-    create_github_tools,
-)
-from ai_army.tools.git_branch_tools import (
-    CheckoutBranchTool,
-    GitBranchStatusTool,
-)
-from ai_army.tools.git_tools import (
-    CreateLocalBranchTool,
-    GitCommitTool,
-    GitForcePushTool,
-    GitPushTool,
-    GitRebaseAbortTool,
-    GitRebaseContinueTool,
-    GitRebaseTool,
-)
-from ai_army.tools.repo_file_tools import (
-    ListDirTool,
-    ReadFileTool,
-    RepoStructureTool,
-    WriteFileTool,
-)
-from ai_army.tools.search_codebase_tool import SearchCodebaseTool
 
-__all__ = [
-    "GitHubRepoConfig",
-    "BreakdownAndCreateSubIssuesTool",
-    "CreateIssueTool",
-    "CreateStructuredIssueTool",
-    "EnrichIssueTool",
-    "UpdateIssueTool",
-    "ListClosedIssuesTool",
-    "ListOpenIssuesTool",
-    "CreatePullRequestTool",
-    "GetPullRequestDetailsTool",
-    "ListPullRequestsTool",
-    "MergePullRequestTool",
-    "ReviewPullRequestTool",
-    "CreateBranchTool",
-    "create_github_tools",
-    "CheckoutBranchTool",
-    "CreateLocalBranchTool",
-    "GitBranchStatusTool",
-    "GitCommitTool",
-    "GitForcePushTool",
-    "GitPushTool",
-    "GitRebaseAbortTool",
-    "GitRebaseContinueTool",
-    "GitRebaseTool",
-    "ListDirTool",
-    "ReadFileTool",
-    "RepoStructureTool",
-    "SearchCodebaseTool",
-    "WriteFileTool",
-]
+# Attribute name -> submodule that defines it.
+_EXPORTS = {
+    "BreakdownAndCreateSubIssuesTool": "github_tools",
+    "CreateBranchTool": "github_tools",
+    "CreateIssueTool": "github_tools",
+    "CreatePullRequestTool": "github_tools",
+    "CreateStructuredIssueTool": "github_tools",
+    "EnrichIssueTool": "github_tools",
+    "GetPullRequestDetailsTool": "github_tools",
+    "ListClosedIssuesTool": "github_tools",
+    "ListOpenIssuesTool": "github_tools",
+    "ListPullRequestsTool": "github_tools",
+    "MergePullRequestTool": "github_tools",
+    "ReviewPullRequestTool": "github_tools",
+    "UpdateIssueTool": "github_tools",
+    "create_github_tools": "github_tools",
+    "CheckoutBranchTool": "git_branch_tools",
+    "GitBranchStatusTool": "git_branch_tools",
+    "CreateLocalBranchTool": "git_tools",
+    "GitCommitTool": "git_tools",
+    "GitForcePushTool": "git_tools",
+    "GitPushTool": "git_tools",
+    "GitRebaseAbortTool": "git_tools",
+    "GitRebaseContinueTool": "git_tools",
+    "GitRebaseTool": "git_tools",
+    "ListDirTool": "repo_file_tools",
+    "ReadFileTool": "repo_file_tools",
+    "RepoStructureTool": "repo_file_tools",
+    "WriteFileTool": "repo_file_tools",
+    "SearchCodebaseTool": "search_codebase_tool",
+}
+
+__all__ = ["GitHubRepoConfig", *_EXPORTS]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value  # cache so subsequent lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -0,0 +1,231 @@
+"""Shared caches, pooled clients, and the retry layer for external API calls.
+
+Crewai-free on purpose: infra modules (repo_clone, scheduler, rag.prebuild)
+import invalidation hooks and the retry helper from here without paying the
+crewai import that the tool modules carry. The GitHub-facing helpers that
+build on these caches live in github_helpers.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from github import Auth, Github, GithubException
+
+logger = logging.getLogger(__name__)
+
+_TRANSIENT_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+def _is_transient_github_error(exc: GithubException) -> bool:
+    """Gateway/availability errors and secondary rate limits are worth retrying."""
+    if exc.status in _TRANSIENT_STATUS_CODES:
+        return True
+    return exc.status == 403 and "secondary rate limit" in str(exc.data or "").lower()
+
+
+def call_with_retries(description: str, func, attempts: int = 4, base_delay: float = 1.0):
+    """Run a GitHub call, retrying transient failures with exponential backoff.
+
+    A mutating call that fails permanently forces the agent to redo the whole
+    step — including any LLM inference that produced its arguments — so
+    absorbing a 502/503/secondary-rate-limit blip here is far cheaper than
+    surfacing it. Non-transient errors raise immediately.
+    """
+    for attempt in range(attempts):
+        try:
+            return func()
+        except GithubException as exc:
+            if not _is_transient_github_error(exc) or attempt == attempts - 1:
+                raise
+            delay = base_delay * (2**attempt)
+            logger.warning(
+                "%s: transient GitHub error (status %s), retrying in %.0fs (%d/%d)",
+                description, exc.status, delay, attempt + 1, attempts - 1,
+            )
+            time.sleep(delay)
+
+
+_CLIENT_CACHE: dict[str, Github] = {}
+_REPO_CACHE: dict[tuple[str, str], Any] = {}
+
+# Shared pool for overlapping independent GitHub round trips. Workers spend
+# their time waiting on sockets, so 8 is plenty; callers submit and wait on
+# their own futures and never shut the pool down.
+IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="gh-io")
+
+
+def close_all_clients() -> None:
+    """Close every cached client's pooled session and drop the caches.
+
+    Long-running daemons accumulate one session per token; relying on GC
+    finalization at interpreter shutdown leaks sockets and raises
+    ResourceWarnings, so this runs via atexit (and can be called directly
+    between reloads).
+    """
+    for client in _CLIENT_CACHE.values():
+        try:
+            client.close()
+        except Exception as e:
+            logger.debug("close_all_clients: %s", e)
+    _CLIENT_CACHE.clear()
+    _REPO_CACHE.clear()
+
+
+atexit.register(close_all_clients)
+
+
+def _get_client(token: str) -> Github:
+    """Return a cached PyGithub client for the token (reuses its connection pool)."""
+    client = _CLIENT_CACHE.get(token)
+    if client is None:
+        # per_page=100 quarters pagination round-trips; retry smooths over
+        # transient 5xx/secondary-rate-limit hiccups on the pooled session.
+        client = Github(auth=Auth.Token(token), per_page=100, retry=3)
+        _CLIENT_CACHE[token] = client
+    return client
+
+
+def _pick_token(token_spec: str) -> str:
+    """Choose the token with the most remaining rate budget from a comma list.
+
+    A repo's token env var may hold several comma-separated tokens; picking
+    the one with the largest remaining budget on each call spreads the
+    request load so no single token exhausts its hourly limit. Single-token
+    specs pass through untouched. PyGithub tracks rate_limiting passively
+    from response headers, so selection costs no extra requests; a token
+    with no client yet counts as fresh and wins outright.
+    """
+    if "," not in token_spec:
+        return token_spec
+    best_token = ""
+    best_remaining = -1
+    for token in (t.strip() for t in token_spec.split(",")):
+        if not token:
+            continue
+        client = _CLIENT_CACHE.get(token)
+        remaining = client.rate_limiting[0] if client is not None else -1
+        if client is None or remaining < 0:
+            return token
+        if remaining > best_remaining:
+            best_token, best_remaining = token, remaining
+    return best_token or token_spec
+
+
+def _get_cached_repo(token: str, repo_name: str):
+    """Resolve a repo handle once per (token, repo); listings on it stay fresh."""
+    token = _pick_token(token)
+    key = (token, repo_name)
+    repo = _REPO_CACHE.get(key)
+    if repo is None:
+        repo = _get_client(token).get_repo(repo_name)
+        _REPO_CACHE[key] = repo
+    return repo
+
+
+def _client_for_repo(repo) -> Github | None:
+    """Find the cached client that owns this repo handle, if we created it."""
+    full_name = getattr(repo, "full_name", None)
+    for token, repo_name in _REPO_CACHE:
+        if repo_name == full_name:
+            return _CLIENT_CACHE.get(token)
+    return None
+
+
+COUNT_CACHE_TTL_SECONDS = 15.0
+_COUNT_CACHE: dict[tuple[str, str], tuple[int, float]] = {}
+
+
+def _cached_count(name: str, repo_config, compute) -> int:
+    """Serve a count from the short-TTL cache, computing (and caching) on miss."""
+    key = (name, repo_config.repo if repo_config else "")
+    now = time.monotonic()
+    hit = _COUNT_CACHE.get(key)
+    if hit is not None and now < hit[1]:
+        return hit[0]
+    value = compute()
+    _COUNT_CACHE[key] = (value, now + COUNT_CACHE_TTL_SECONDS)
+    return value
+
+
+LIST_CACHE_TTL_SECONDS = 30.0
+_LIST_CACHE: dict[tuple, tuple[str, float]] = {}
+
+
+def cached_listing(key: tuple | None, compute):
+    """Serve a formatted listing from the short-TTL cache, computing on miss.
+
+    Planning loops re-issue the same list reads within seconds; caching the
+    already-formatted string skips the round trip and the formatting. Pass
+    key=None (e.g. for repos without a full_name) to bypass caching.
+    """
+    if key is None:
+        return compute()
+    now = time.monotonic()
+    hit = _LIST_CACHE.get(key)
+    if hit is not None and now < hit[1]:
+        return hit[0]
+    value = compute()
+    _LIST_CACHE[key] = (value, now + LIST_CACHE_TTL_SECONDS)
+    return value
+
+
+PR_MAP_TTL_SECONDS = 30.0
+_PR_MAP_CACHE: dict[str, tuple[dict[int, Any], float]] = {}
+
+
+def invalidate_issue_counts() -> None:
+    """Drop cached issue counts, listings, and PR links; called after writes so gates see them."""
+    _COUNT_CACHE.clear()
+    _LIST_CACHE.clear()
+    # The PR-linkage map must also reflect a PR this process just created or
+    # merged, or issue_has_open_pr denies it for the rest of the TTL.
+    _PR_MAP_CACHE.clear()
+
+
+_OBJECT_CACHE: dict[tuple[str, str, int], Any] = {}
+
+
+def _get_object_conditional(repo, kind: str, number: int, fetch):
+    """Fetch an issue/PR with ETag revalidation when we have seen it before.
+
+    PyGithub objects remember their ETag; update() re-requests with
+    If-None-Match, and a 304 answer carries no body and does not consume
+    primary rate limit. Falls back to a plain fetch for repo doubles without
+    full_name or when revalidation fails.
+    """
+    full_name = getattr(repo, "full_name", None)
+    key = (full_name, kind, number) if full_name else None
+    cached = _OBJECT_CACHE.get(key) if key else None
+    if cached is not None:
+        try:
+            cached.update()
+            return cached
+        except Exception as e:
+            logger.debug("conditional %s #%s refresh failed, refetching: %s", kind, number, e)
+    obj = fetch(number)
+    if key:
+        _OBJECT_CACHE[key] = obj
+    return obj
+
+
+def get_issue_cached(repo, issue_number: int):
+    """Get an issue, revalidating a cached copy via ETag when possible."""
+    return _get_object_conditional(repo, "issue", issue_number, repo.get_issue)
+
+
+def get_pull_cached(repo, pr_number: int):
+    """Get a pull request, revalidating a cached copy via ETag when possible."""
+    return _get_object_conditional(repo, "pull", pr_number, repo.get_pull)
+
+
+_BASE_REF_CACHE: dict[tuple[str, str], str] = {}
+
+
+def invalidate_base_ref_cache() -> None:
+    """Clear cached base refs; call after a fetch/pull that may create main."""
+    _BASE_REF_CACHE.clear()
@@ -5,27 +5,48 @@ Used by Dev agents to see what's done on a branch and to checkout existing branc
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Type
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from ai_army.tools.git_tools import _repo_path, _run_git
+# The cache itself lives in the crewai-free api_cache module so infra code
+# (repo_clone) can invalidate it without importing the crewai tool stack.
+from ai_army.tools.api_cache import _BASE_REF_CACHE, invalidate_base_ref_cache  # noqa: F401
+from ai_army.tools.git_tools import _current_branch, _repo_path, _run_git
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_BASE = "main"
 
+_ISSUE_BRANCH_RE = re.compile(r"issue-(\d+)(?:-|$)", re.IGNORECASE)
+
 
 def _run_git_in(repo_path: Path, *args: str) -> str:
     """Run git in repo_path; return output or error string."""
     return _run_git(repo_path, *args)
 
 
+def _resolve_base_ref(repo_path: Path, preferred: str) -> str:
+    """Pick 'main' vs 'origin/main' once per repo; the answer is stable in-process."""
+    key = (str(repo_path), preferred)
+    cached = _BASE_REF_CACHE.get(key)
+    if cached is not None:
+        return cached
+    base = preferred
+    if preferred == "main":
+        check_main = _run_git_in(repo_path, "rev-parse", "--verify", "main")
+        if "exited" in check_main:
+            base = "origin/main"
+    _BASE_REF_CACHE[key] = base
+    return base
+
+
 def _infer_issue_from_branch(branch_name: str) -> int | None:
     """Parse feature/issue-N-* pattern to infer issue number."""
-    match = re.search(r"issue-(\d+)(?:-|$)", branch_name, re.IGNORECASE)
+    match = _ISSUE_BRANCH_RE.search(branch_name)
     return int(match.group(1)) if match else None
 
 
@@ -66,7 +87,7 @@ class GitBranchStatusTool(BaseTool):
             return "Local repo not configured. Set LOCAL_REPO_PATH to the path of your cloned repo."
 
         if not branch_name.strip():
-            out = _run_git_in(repo, "rev-parse", "--abbrev-ref", "HEAD")
+            out = _current_branch(repo)
             if "exited" in out:
                 return out
             branch_name = out.strip()
@@ -80,22 +101,29 @@ class GitBranchStatusTool(BaseTool):
             return f"Branch '{branch_name}' not found (local or remote)."
 
         # Resolve base ref - try origin/main if main not local
-        base = base_ref
-        if base == "main":
-            check_main = _run_git_in(repo, "rev-parse", "--verify", "main")
-            if "exited" in check_main:
-                base = "origin/main"
-
-        log_out = _run_git_in(repo, "log", f"{base}..{branch_name}", "--oneline")
+        base = _resolve_base_ref(repo, base_ref)
+
+        # log/count/diff/branch -r are independent once branch and base are
+        # resolved; run them concurrently — each blocks on subprocess IO, not CPU.
+        # The log is capped at the 10 commits we display; rev-list --count gives
+        # the exact ahead-count without materializing the full log output.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            log_future = executor.submit(
+                _run_git_in, repo, "log", f"{base}..{branch_name}", "--oneline", "--max-count=10"
+            )
+            count_future = executor.submit(_run_git_in, repo, "rev-list", "--count", f"{base}..{branch_name}")
+            diff_future = executor.submit(_run_git_in, repo, "diff", f"{base}..{branch_name}", "--stat")
+            remote_future = executor.submit(_run_git_in, repo, "branch", "-r")
+            log_out = log_future.result()
+            count_out = count_future.result()
+            diff_out = diff_future.result()
+            remote_out = remote_future.result()
         if "exited" in log_out:
             return log_out
 
-        diff_out = _run_git_in(repo, "diff", f"{base}..{branch_name}", "--stat")
         if "exited" in diff_out:
             diff_out = "(diff failed)"
 
-        # Check if on remote
-        remote_out = _run_git_in(repo, "branch", "-r")
         on_remote = "exited" not in remote_out and f"origin/{branch_name}" in remote_out
 
         lines = []
@@ -106,14 +134,26 @@ class GitBranchStatusTool(BaseTool):
         lines.append(header + ":")
 
         commit_lines = [l.strip() for l in log_out.splitlines() if l.strip()]
-        lines.append(f"  Commits ahead of {base}: {len(commit_lines)}")
+        try:
+            ahead_count = int(count_out.strip())
+        except ValueError:
+            ahead_count = len(commit_lines)
+        lines.append(f"  Commits ahead of {base}: {ahead_count}")
         for c in commit_lines[:10]:
             lines.append(f"  - {c}")
-        if len(commit_lines) > 10:
-            lines.append(f"  ... and {len(commit_lines) - 10} more")
+        if ahead_count > 10:
+            lines.append(f"  ... and {ahead_count - 10} more")
 
         if diff_out and diff_out.strip():
-            files = [l.split("|")[0].strip() for l in diff_out.splitlines() if "|" in l]
+            # partition allocates one 3-tuple per line vs split's full segment
+            # list; the display caps at 8 files, so stop parsing shortly after.
+            files = []
+            for line in diff_out.splitlines():
+                name, sep, _ = line.partition("|")
+                if sep:
+                    files.append(name.strip())
+                    if len(files) >= 16:
+                        break
             if files:
                 lines.append("  Files changed: " + ", ".join(files[:8]))
                 if len(files) > 8:
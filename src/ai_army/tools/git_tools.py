@@ -18,17 +18,64 @@ from ai_army.config.settings import settings
 logger = logging.getLogger(__name__)
 
 
+_REPO_PATH_CACHE: dict[str, Path] = {}
+
+
 def _repo_path(override: str | None = None) -> Path | None:
-    """Resolve the local repo path. Returns None if not configured."""
+    """Resolve the local repo path. Returns None if not configured.
+
+    Successful resolutions are cached per path string so chained tool calls
+    skip the expanduser/resolve/.git stat syscalls; misses (not yet cloned,
+    not a repo) are re-checked every time.
+    """
     path = override or settings.local_repo_path
     if not path or not path.strip():
         return None
+    cached = _REPO_PATH_CACHE.get(path)
+    if cached is not None:
+        return cached
     p = Path(path).expanduser().resolve()
     if not (p / ".git").exists():
         return None
+    _REPO_PATH_CACHE[path] = p
     return p
 
 
+_PYGIT2_REPOS: dict[str, object] = {}
+
+
+def _open_repo(repo_path: Path):
+    """Open (and cache) a pygit2 repository; None when pygit2 is unavailable."""
+    try:
+        import pygit2
+    except ImportError:
+        return None
+    key = str(repo_path)
+    repo = _PYGIT2_REPOS.get(key)
+    if repo is None:
+        try:
+            repo = pygit2.Repository(key)
+        except Exception:
+            return None
+        _PYGIT2_REPOS[key] = repo
+    return repo
+
+
+def _current_branch(repo_path: Path) -> str:
+    """Resolve the current branch name without forking git when pygit2 is available.
+
+    Falls back to 'git rev-parse --abbrev-ref HEAD' and preserves its
+    error-string contract ('git exited N: ...') for callers.
+    """
+    repo = _open_repo(repo_path)
+    if repo is not None:
+        try:
+            return repo.head.shorthand
+        except Exception:
+            pass  # Unborn/detached HEAD edge cases: let git report it
+    return _run_git(repo_path, "rev-parse", "--abbrev-ref", "HEAD")
+
+
 def _run_git(repo_path: Path, *args: str) -> str:
     """Run a git command in repo_path. Returns combined stdout and stderr."""
     result = subprocess.run(
@@ -161,29 +208,27 @@ class GitCommitTool(BaseTool):
             logger.warning("GitCommitTool: local repo not configured")
             return "Local repo not configured. Set LOCAL_REPO_PATH to the path of your cloned repo."
         add_args = paths.split() if paths.strip() != "." else ["."]
-        _run_git(repo, "add", *add_args)
+        add_out = _run_git(repo, "add", *add_args)
+        if "exited" in add_out:
+            return add_out
         git_name, git_email = build_agent_identity(self._agent_name)
-        env = {
-            **os.environ,
-            "GIT_AUTHOR_NAME": git_name,
-            "GIT_AUTHOR_EMAIL": git_email,
-            "GIT_COMMITTER_NAME": git_name,
-            "GIT_COMMITTER_EMAIL": git_email,
-        }
-        result = subprocess.run(
-            ["git", "commit", "-m", message],
-            cwd=repo,
-            capture_output=True,
-            text=True,
-            timeout=60,
-            env=env,
+        result = _run_git_result(
+            repo,
+            "commit",
+            "-m",
+            message,
+            env={
+                **os.environ,
+                "GIT_AUTHOR_NAME": git_name,
+                "GIT_AUTHOR_EMAIL": git_email,
+                "GIT_COMMITTER_NAME": git_name,
+                "GIT_COMMITTER_EMAIL": git_email,
+            },
         )
-        out = _combined_output(result)
         if result.returncode != 0:
+            out = _combined_output(result)
             logger.warning("git commit -m %s failed (exit %s): %s", message[:80], result.returncode, out[:200])
             return f"git exited {result.returncode}: {out}"
-        if "exited" in out:
-            return out
         logger.info("GitCommitTool: committed as %s <%s>: %s", git_name, git_email, message[:80])
         return f"Committed: {message}"
 
@@ -223,7 +268,7 @@ class GitPushTool(BaseTool):
         if branch.strip():
             refspec = branch
         else:
-            out = _run_git(repo, "rev-parse", "--abbrev-ref", "HEAD")
+            out = _current_branch(repo)
             if "exited" in out:
                 return out
             refspec = out.strip()
@@ -392,7 +437,7 @@ class GitForcePushTool(BaseTool):
             return "Local repo not configured. Set LOCAL_REPO_PATH to the path of your cloned repo."
         refspec = branch.strip()
         if not refspec:
-            out = _run_git(repo, "rev-parse", "--abbrev-ref", "HEAD")
+            out = _current_branch(repo)
             if "exited" in out:
                 return out
             refspec = out.strip()
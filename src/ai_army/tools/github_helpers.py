@@ -9,14 +9,47 @@ from dataclasses import dataclass, field
 from typing import Any
 
 import yaml
-from github import Auth, Github
+from github import GithubException
 
 from ai_army.config.settings import get_github_repos, settings
 from ai_army.config.settings import GitHubRepoConfig
 
+# The caching/retry layer lives in api_cache (crewai-free, shared with infra
+# modules); these names are re-exported here for the tool modules and tests
+# that import them from github_helpers.
+from ai_army.tools.api_cache import (  # noqa: F401
+    COUNT_CACHE_TTL_SECONDS,
+    IO_POOL,
+    PR_MAP_TTL_SECONDS,
+    _cached_count,
+    _client_for_repo,
+    _COUNT_CACHE,
+    _get_cached_repo,
+    _get_client,
+    _pick_token,
+    _PR_MAP_CACHE,
+    cached_listing,
+    call_with_retries,
+    close_all_clients,
+    get_issue_cached,
+    get_pull_cached,
+    invalidate_issue_counts,
+)
+
 logger = logging.getLogger(__name__)
 
-DEV_REVIEW_LABELS = {"in-review", "awaiting-review", "awaiting-merge"}
+DEV_REVIEW_LABELS = frozenset({"in-review", "awaiting-review", "awaiting-merge"})
+
+# Labels that disqualify a backlog/feature issue from promotion.
+_PROMOTION_BLOCKERS = frozenset({"prioritized", "ready-for-breakdown", "broken-down"})
+
+_CLOSING_REFERENCE_RE = re.compile(
+    r"(?:close[sd]?|fix(?:e[sd])?|resolve[sd]?)\s*(?:[\w.-]+/[\w.-]+)?#(\d+)",
+    re.IGNORECASE,
+)
+
+_META_BLOCK_RE = re.compile(r"<!--\s*ai-army-meta\s*(.*?)-->", re.DOTALL | re.IGNORECASE)
+_ISSUE_REF_RE = re.compile(r"#?(\d+)")
 
 
 @dataclass
@@ -41,28 +74,27 @@ class DevIssueCandidate:
     linked_pr_number: int | None = None
     linked_pr_branch: str = ""
     linked_pr_mergeable: bool | None = None
+    labels: set[str] = field(default_factory=set)
 
 
 def _get_repo_from_config(config: GitHubRepoConfig | None = None):
-    """Get the target repository. Uses config if provided, else first repo from settings."""
+    """Get the target repository. Uses config if provided, else first repo from settings.
+
+    Repo handles are cached per (token, repo), so calling this from every
+    tool _run costs one GET /repos/{owner}/{repo} per process, not per call.
+    """
     if config:
-        auth = Auth.Token(config.token)
-        client = Github(auth=auth)
-        return client.get_repo(config.repo)
+        return _get_cached_repo(config.token, config.repo)
     repos = get_github_repos()
     if not repos:
         if settings.github_target_token and settings.github_target_repo:
-            auth = Auth.Token(settings.github_target_token)
-            client = Github(auth=auth)
-            return client.get_repo(settings.github_target_repo)
+            return _get_cached_repo(settings.github_target_token, settings.github_target_repo)
         logger.error("No GitHub repo configured. Set GITHUB_TARGET_REPO and GITHUB_TARGET_TOKEN or GITHUB_REPO_1 and GITHUB_TOKEN_1.")
         raise ValueError(
             "No GitHub repo configured. Set GITHUB_TARGET_REPO and GITHUB_TARGET_TOKEN or GITHUB_REPO_1 and GITHUB_TOKEN_1."
         )
     c = repos[0]
-    auth = Auth.Token(c.token)
-    client = Github(auth=auth)
-    return client.get_repo(c.repo)
+    return _get_cached_repo(c.token, c.repo)
 
 
 def get_repo_from_config(config: GitHubRepoConfig | None = None):
@@ -74,7 +106,7 @@ def _issue_meta_block(issue_body: str | None) -> str:
     """Return the embedded ai-army metadata block, if present."""
     if not issue_body:
         return ""
-    match = re.search(r"<!--\s*ai-army-meta\s*(.*?)-->", issue_body, re.DOTALL | re.IGNORECASE)
+    match = _META_BLOCK_RE.search(issue_body)
     return match.group(1).strip() if match else ""
 
 
@@ -95,7 +127,7 @@ def parse_issue_execution_meta(issue_body: str | None) -> IssueExecutionMeta:
         file_scope = [file_scope]
     depends_on = payload.get("depends_on")
     if isinstance(depends_on, str):
-        match = re.search(r"#?(\d+)", depends_on)
+        match = _ISSUE_REF_RE.search(depends_on)
         depends_on = int(match.group(1)) if match else None
     priority = payload.get("priority", 100)
     try:
@@ -110,19 +142,69 @@ def parse_issue_execution_meta(issue_body: str | None) -> IssueExecutionMeta:
 
 
 def get_open_issue_count(repo) -> int:
-    """Count open issues only (exclude pull requests)."""
-    issues = list(repo.get_issues(state="open"))
-    return sum(1 for i in issues if not i.pull_request)
+    """Count open issues only (exclude pull requests).
+
+    Uses the Search API when possible: 'is:issue is:open' filters out PRs
+    server-side and the count comes from one response's total_count instead
+    of paginating every open issue. Falls back to listing for repo objects
+    we did not create (e.g. test doubles).
+    """
+    full_name = getattr(repo, "full_name", None)
+    if full_name:
+        key = ("open_issue_count", full_name)
+        hit = _COUNT_CACHE.get(key)
+        if hit is not None and time.monotonic() < hit[1]:
+            return hit[0]
+    count = None
+    client = _client_for_repo(repo)
+    if client is not None:
+        try:
+            count = client.search_issues(f"repo:{repo.full_name} is:issue is:open").totalCount
+        except Exception as e:
+            logger.debug("get_open_issue_count: search fallback to listing: %s", e)
+    if count is None:
+        count = sum(1 for i in repo.get_issues(state="open") if not i.pull_request)
+    if full_name:
+        _COUNT_CACHE[key] = (count, time.monotonic() + COUNT_CACHE_TTL_SECONDS)
+    return count
 
 
-def get_repo_readme(repo) -> str:
-    """Fetch README content from the repo. Returns empty string if missing or on error."""
+_README_CACHE: dict[tuple[str, int | None], str] = {}
+
+
+def get_repo_readme(repo, max_bytes: int | None = 65536) -> str:
+    """Fetch README content from the repo. Returns empty string if missing or on error.
+
+    Truncates to max_bytes before decoding so a pathologically large README
+    never becomes a multi-hundred-KB str; callers only feed a prefix and the
+    top-of-file product sections into prompts. Pass None for the full text.
+    READMEs change rarely, so results (including a definitive 404) are
+    memoized per repo for the life of the process; other errors are logged
+    at warning so rate-limit/auth problems are not mistaken for a missing
+    README, and are not cached.
+    """
+    full_name = getattr(repo, "full_name", None)
+    key = (full_name, max_bytes)
+    if full_name and key in _README_CACHE:
+        return _README_CACHE[key]
     try:
-        readme = repo.get_readme()
-        return readme.decoded_content.decode("utf-8", errors="replace")
+        raw = repo.get_readme().decoded_content
+        if max_bytes is not None:
+            raw = raw[:max_bytes]
+        text = raw.decode("utf-8", errors="replace")
+    except GithubException as e:
+        if e.status == 404:
+            logger.debug("get_repo_readme: no README in %s", full_name or "repo")
+            text = ""
+        else:
+            logger.warning("get_repo_readme: GitHub error fetching README (status %s): %s", e.status, e)
+            return ""
     except Exception as e:
-        logger.debug("get_repo_readme: could not fetch README: %s", e)
+        logger.warning("get_repo_readme: could not fetch README: %s", e)
         return ""
+    if full_name:
+        _README_CACHE[key] = text
+    return text
 
 
 def extract_product_sections_from_readme(readme: str) -> dict[str, str]:
@@ -149,15 +231,19 @@ def extract_product_sections_from_readme(readme: str) -> dict[str, str]:
 
 def count_issues_ready_for_breakdown(repo_config: GitHubRepoConfig | None = None) -> int:
     """Count open issues with ready-for-breakdown that do NOT have broken-down. GitHub API only."""
+    return _cached_count(
+        "ready_for_breakdown", repo_config, lambda: _count_issues_ready_for_breakdown(repo_config)
+    )
+
+
+def _count_issues_ready_for_breakdown(repo_config: GitHubRepoConfig | None = None) -> int:
     try:
         repo = _get_repo_from_config(repo_config)
-        issues = list(repo.get_issues(state="open", labels=["ready-for-breakdown"]))
         count = 0
-        for i in issues:
+        for i in repo.get_issues(state="open", labels=["ready-for-breakdown"]):
             if i.pull_request:
                 continue
-            label_names = {l.name for l in (i.labels or [])}
-            if "broken-down" not in label_names:
+            if not any(l.name == "broken-down" for l in (i.labels or [])):
                 count += 1
         return count
     except Exception as e:
@@ -167,15 +253,21 @@ def count_issues_ready_for_breakdown(repo_config: GitHubRepoConfig | None = None
 
 def count_prioritized_needing_enrichment(repo_config: GitHubRepoConfig | None = None) -> int:
     """Count open issues with 'prioritized' but NOT 'ready-for-breakdown'. GitHub API only."""
+    return _cached_count(
+        "prioritized_needing_enrichment",
+        repo_config,
+        lambda: _count_prioritized_needing_enrichment(repo_config),
+    )
+
+
+def _count_prioritized_needing_enrichment(repo_config: GitHubRepoConfig | None = None) -> int:
     try:
         repo = _get_repo_from_config(repo_config)
-        issues = list(repo.get_issues(state="open", labels=["prioritized"]))
         count = 0
-        for i in issues:
+        for i in repo.get_issues(state="open", labels=["prioritized"]):
             if i.pull_request:
                 continue
-            label_names = {l.name for l in (i.labels or [])}
-            if "ready-for-breakdown" not in label_names:
+            if not any(l.name == "ready-for-breakdown" for l in (i.labels or [])):
                 count += 1
         return count
     except Exception as e:
@@ -189,6 +281,10 @@ def count_backlog_promotable(repo_config: GitHubRepoConfig | None = None) -> int
     Includes issues with 'backlog' or 'feature' that lack 'prioritized' and 'ready-for-breakdown'.
     Excludes parent issues already broken-down (they have sub-issues).
     """
+    return _cached_count("backlog_promotable", repo_config, lambda: _count_backlog_promotable(repo_config))
+
+
+def _count_backlog_promotable(repo_config: GitHubRepoConfig | None = None) -> int:
     try:
         repo = _get_repo_from_config(repo_config)
         # Fetch backlog and feature issues; union via iteration
@@ -199,11 +295,8 @@ def count_backlog_promotable(repo_config: GitHubRepoConfig | None = None) -> int
                 if i.pull_request or i.number in seen:
                     continue
                 seen.add(i.number)
-                label_names = {l.name for l in (i.labels or [])}
-                if "prioritized" in label_names or "ready-for-breakdown" in label_names:
-                    continue
-                if "broken-down" in label_names:
-                    continue  # Parent already processed
+                if any(l.name in _PROMOTION_BLOCKERS for l in (i.labels or [])):
+                    continue  # Already in the pipeline, or parent already processed
                 count += 1
         return count
     except Exception as e:
@@ -215,8 +308,7 @@ def _issue_linked_in_pr_body(pr_body: str | None, issue_number: int) -> bool:
     """Check if PR body contains a GitHub-closing reference for the given issue."""
     if not pr_body:
         return False
-    pattern = r"(?:close[sd]?|fix(?:e[sd])?|resolve[sd]?)\s*(?:[\w.-]+/[\w.-]+)?#(\d+)"
-    for match in re.finditer(pattern, pr_body, re.IGNORECASE):
+    for match in _CLOSING_REFERENCE_RE.finditer(pr_body):
         if int(match.group(1)) == issue_number:
             return True
     return False
@@ -234,20 +326,40 @@ def _refresh_mergeable(repo, pr_number: int, attempts: int = 3, delay_seconds: f
     return mergeable
 
 
-def find_linked_open_pr(repo, issue_number: int):
-    """Return the first open PR that links to the issue via Closes/Fixes."""
+def _linked_open_pr_map(repo) -> dict[int, Any]:
+    """Map issue number -> first open PR closing it, from a single PR listing pass.
+
+    Batch equivalent of find_linked_open_pr: one paginated request instead of
+    re-scanning all open PRs per issue (O(N+M) instead of O(N*M) API calls).
+    Memoized briefly so the helpers invoked back-to-back within one scheduling
+    pass share a single fetch.
+    """
+    key = getattr(repo, "full_name", None)
+    cached = _PR_MAP_CACHE.get(key) if key else None
+    now = time.monotonic()
+    if cached is not None and now < cached[1]:
+        return cached[0]
+    mapping: dict[int, Any] = {}
     try:
         for pr in repo.get_pulls(state="open"):
-            if _issue_linked_in_pr_body(pr.body, issue_number):
-                return pr
+            for match in _CLOSING_REFERENCE_RE.finditer(pr.body or ""):
+                mapping.setdefault(int(match.group(1)), pr)
     except Exception as e:
-        logger.warning("find_linked_open_pr(%s) failed: %s", issue_number, e)
-    return None
+        logger.warning("_linked_open_pr_map failed: %s", e)
+        return mapping  # Don't cache a partial map from a failed fetch
+    if key:
+        _PR_MAP_CACHE[key] = (mapping, now + PR_MAP_TTL_SECONDS)
+    return mapping
+
+
+def find_linked_open_pr(repo, issue_number: int):
+    """Return the first open PR that links to the issue via Closes/Fixes."""
+    return _linked_open_pr_map(repo).get(issue_number)
 
 
 def issue_has_open_pr(repo, issue_number: int) -> bool:
     """Check if any open PR references this issue via Closes #N or Fixes #N."""
-    return find_linked_open_pr(repo, issue_number) is not None
+    return issue_number in _linked_open_pr_map(repo)
 
 
 def dependency_is_satisfied(repo, dependency_issue_number: int | None) -> bool:
@@ -255,7 +367,7 @@ def dependency_is_satisfied(repo, dependency_issue_number: int | None) -> bool:
     if not dependency_issue_number:
         return True
     try:
-        dependency = repo.get_issue(dependency_issue_number)
+        dependency = get_issue_cached(repo, dependency_issue_number)
     except Exception as exc:
         logger.warning("dependency_is_satisfied(%s) failed to fetch issue: %s", dependency_issue_number, exc)
         return False
@@ -272,14 +384,14 @@ def list_dev_issue_candidates(
     """Return dev candidates enriched with dependency and PR metadata."""
     try:
         repo = _get_repo_from_config(repo_config)
-        issues = list(repo.get_issues(state="open", labels=[agent_type]))
+        pr_map = _linked_open_pr_map(repo)
         candidates: list[DevIssueCandidate] = []
-        for issue in issues:
+        for issue in repo.get_issues(state="open", labels=[agent_type]):
             if issue.pull_request:
                 continue
             labels = {label.name for label in (issue.labels or [])}
             meta = parse_issue_execution_meta(issue.body or "")
-            linked_pr = find_linked_open_pr(repo, issue.number)
+            linked_pr = pr_map.get(issue.number)
             mergeable = _refresh_mergeable(repo, linked_pr.number) if linked_pr else None
             candidates.append(
                 DevIssueCandidate(
@@ -292,6 +404,7 @@ def list_dev_issue_candidates(
                     linked_pr_number=linked_pr.number if linked_pr else None,
                     linked_pr_branch=linked_pr.head.ref if linked_pr else "",
                     linked_pr_mergeable=mergeable,
+                    labels=labels,
                 )
             )
         candidates.sort(key=lambda candidate: (candidate.priority, candidate.issue_number))
@@ -326,9 +439,7 @@ def list_issues_for_dev(
     try:
         repo = _get_repo_from_config(repo_config)
         for candidate in list_dev_issue_candidates(repo_config, agent_type):
-            issue = repo.get_issue(candidate.issue_number)
-            labels = {label.name for label in (issue.labels or [])}
-            if DEV_REVIEW_LABELS & labels:
+            if DEV_REVIEW_LABELS & candidate.labels:
                 continue
             if not dependency_is_satisfied(repo, candidate.depends_on):
                 continue
@@ -349,14 +460,13 @@ def find_conflicting_agent_prs(
     try:
         repo = _get_repo_from_config(repo_config)
         conflicts: list[dict[str, Any]] = []
-        issues = list(repo.get_issues(state="open", labels=[agent_type]))
-        for issue in issues:
+        pr_map = _linked_open_pr_map(repo)
+        for issue in repo.get_issues(state="open", labels=[agent_type]):
             if issue.pull_request:
                 continue
-            labels = {label.name for label in (issue.labels or [])}
-            if "in-progress" not in labels and not (DEV_REVIEW_LABELS & labels):
+            if not any(l.name == "in-progress" or l.name in DEV_REVIEW_LABELS for l in (issue.labels or [])):
                 continue
-            pr = find_linked_open_pr(repo, issue.number)
+            pr = pr_map.get(issue.number)
             if not pr:
                 continue
             mergeable = _refresh_mergeable(repo, pr.number)
@@ -386,15 +496,19 @@ def check_github_connection_and_log(
     """
     if repos is None:
         repos = get_github_repos()
-    results: list[tuple[GitHubRepoConfig, bool]] = []
-    for cfg in repos:
+    if not repos:
+        return []
+
+    def _check_one(cfg: GitHubRepoConfig) -> tuple[GitHubRepoConfig, bool]:
         try:
-            client = Github(auth=Auth.Token(cfg.token))
+            client = _get_client(_pick_token(cfg.token))
             repo = client.get_repo(cfg.repo)
             _ = repo.full_name
             logger.info("GitHub connected | repo: %s", cfg.repo)
-            results.append((cfg, True))
+            return (cfg, True)
         except Exception as e:
             logger.warning("GitHub connection failed | repo: %s | %s", cfg.repo, e)
-            results.append((cfg, False))
-    return results
+            return (cfg, False)
+
+    # Each check is a network round-trip; overlap them so startup is O(1) in repo count
+    return list(IO_POOL.map(_check_one, repos))
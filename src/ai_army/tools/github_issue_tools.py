@@ -1,6 +1,7 @@
 """GitHub issue tools: Create, Update, List Open. CrewAI tools wrapping PyGithub."""
 
 import logging
+from itertools import islice
 from pathlib import PurePosixPath
 from typing import Any, Type
 
@@ -9,7 +10,15 @@ from pydantic import BaseModel, Field
 
 from ai_army.config.settings import GitHubRepoConfig
 from ai_army.repo_clone import ensure_repo_cloned
-from ai_army.tools.github_helpers import _get_repo_from_config
+from ai_army.tools.github_helpers import (
+    IO_POOL,
+    _client_for_repo,
+    _get_repo_from_config,
+    cached_listing,
+    call_with_retries,
+    get_issue_cached,
+    invalidate_issue_counts,
+)
 from ai_army.tools.repo_file_tools import RepoStructureTool
 
 logger = logging.getLogger(__name__)
@@ -64,6 +73,91 @@ def _format_issue_meta(*, file_scope: list[str], depends_on: int | None, priorit
     )
 
 
+def _label_names(issue) -> list[str]:
+    """Label names straight from the listing payload, skipping per-Label wrapping."""
+    raw = getattr(issue, "raw_data", None)
+    if isinstance(raw, dict):
+        return [label["name"] for label in raw.get("labels", [])]
+    return [label.name for label in (issue.labels or [])]
+
+
+def _create_issue(repo_config: GitHubRepoConfig | None, title: str, body: str, labels: list[str]) -> str:
+    """Create an issue directly. Internal fast path: no tool/Pydantic construction."""
+    repo = _get_repo_from_config(repo_config)
+    issue = call_with_retries(
+        "create_issue", lambda: repo.create_issue(title=title, body=body, labels=labels)
+    )
+    invalidate_issue_counts()
+    logger.info("Created issue #%s: %s (labels: %s)", issue.number, title, labels)
+    return f"Created issue #{issue.number}: {title} (labels: {labels})"
+
+
+def _update_issue(
+    repo_config: GitHubRepoConfig | None,
+    issue_number: int,
+    comment: str = "",
+    labels_to_add: list[str] | None = None,
+    labels_to_remove: list[str] | None = None,
+    assignee: str = "",
+    issue=None,
+) -> str:
+    """Update an issue directly. Internal fast path: no tool/Pydantic construction.
+
+    Callers that already hold the Issue object pass it via ``issue`` to skip
+    the fetch round trip.
+    """
+    labels_to_add = labels_to_add or []
+    labels_to_remove = labels_to_remove or []
+    if not (comment or labels_to_add or labels_to_remove or assignee):
+        # Nothing to do — don't spend a round trip fetching the issue.
+        return "No updates applied"
+    if issue is None:
+        try:
+            repo = _get_repo_from_config(repo_config)
+            issue = get_issue_cached(repo, issue_number)
+        except Exception as e:
+            logger.exception("UpdateIssueTool: could not fetch issue #%s: %s", issue_number, e)
+            raise
+    actions = []
+    # The comment POST and the PATCH below are independent; overlap them on
+    # the shared pool so the update costs max-of-latencies, not the sum.
+    futures = []
+    if comment:
+        futures.append(IO_POOL.submit(call_with_retries, "create_comment", lambda: issue.create_comment(comment)))
+        actions.append("added comment")
+    # Labels and assignees go through the same PATCH /issues/{n}, so batch
+    # them into one edit() instead of separate set_labels/add_to_assignees calls.
+    edit_kwargs = {}
+    if labels_to_add or labels_to_remove:
+        current = set(_label_names(issue))
+        new = (current | set(labels_to_add)) - set(labels_to_remove)
+        if new != current:
+            edit_kwargs["labels"] = sorted(new)
+        actions.extend(f"added label '{label}'" for label in labels_to_add)
+        actions.extend(f"removed label '{label}'" for label in labels_to_remove)
+    if assignee:
+        raw = getattr(issue, "raw_data", None)
+        if isinstance(raw, dict) and "assignees" in raw:
+            current_assignees = {a["login"] for a in raw["assignees"]}
+        else:
+            current_assignees = {a.login for a in (issue.assignees or [])}
+        if assignee not in current_assignees:
+            edit_kwargs["assignees"] = sorted(current_assignees | {assignee})
+        actions.append(f"assigned to {assignee}")
+    if edit_kwargs:
+        futures.append(IO_POOL.submit(call_with_retries, "edit_issue", lambda: issue.edit(**edit_kwargs)))
+    for future in futures:
+        future.result()
+    if actions:
+        invalidate_issue_counts()
+        logger.info("UpdateIssueTool: updated issue #%s - %s", issue_number, ", ".join(actions))
+    return (
+        f"Updated issue #{issue_number}: {', '.join(actions) or 'no changes'}"
+        if actions
+        else "No updates applied"
+    )
+
+
 class CreateIssueInput(BaseModel):
     """Input schema for CreateIssueTool."""
 
@@ -87,12 +181,8 @@ class CreateIssueTool(BaseTool):
         self._repo_config = repo_config
 
     def _run(self, title: str, body: str = "", labels: list[str] | None = None) -> str:
-        labels = labels or []
         try:
-            repo = _get_repo_from_config(self._repo_config)
-            issue = repo.create_issue(title=title, body=body, labels=labels)
-            logger.info("Created issue #%s: %s (labels: %s)", issue.number, title, labels)
-            return f"Created issue #{issue.number}: {title} (labels: {labels})"
+            return _create_issue(self._repo_config, title, body, labels or [])
         except Exception as e:
             logger.exception("CreateIssueTool failed: %s", e)
             raise
@@ -127,31 +217,36 @@ class CreateStructuredIssueTool(BaseTool):
         super().__init__(**kwargs)
         self._repo_config = repo_config
         self._product_context = product_context or {}
-
-    def _run(self, description: str) -> str:
-        from ai_army.chains.product_chains import create_issue_chain
-        from ai_army.schemas.product_schemas import IssueSpec
-
+        # The context never changes for this instance; building it once keeps
+        # prompts byte-identical across calls, which is what the LLM cache keys on.
         ctx = self._product_context
-        context_block = ""
+        parts = []
         if ctx.get("readme"):
-            context_block += f"\n\nProject README (excerpt):\n{ctx['readme'][:2000]}..."
+            parts.append(f"\n\nProject README (excerpt):\n{ctx['readme'][:2000]}...")
         if ctx.get("product_overview"):
-            context_block += f"\n\nProduct Overview: {ctx['product_overview']}"
+            parts.append(f"\n\nProduct Overview: {ctx['product_overview']}")
         if ctx.get("product_goal"):
-            context_block += f"\n\nProduct Goal: {ctx['product_goal']}"
+            parts.append(f"\n\nProduct Goal: {ctx['product_goal']}")
+        self._context_block = "".join(parts)
+
+    def _run(self, description: str) -> str:
+        from ai_army.chains.product_chains import create_issue_chain
+        from ai_army.schemas.product_schemas import IssueSpec
 
         prompt = f"""Create a structured GitHub issue from the following description.
 
-{context_block}
+{self._context_block}
 
 Description:
 {description}
 
 Produce a complete issue with: title, body, labels (always include 'backlog' and 'prioritized' for product issues; add feature/bug as needed), acceptance_criteria (list of strings), and technical_notes."""
         try:
+            from ai_army.chains.llm_cache import invoke_cached
+            from ai_army.config.llm_config import get_llm_model
+
             chain = create_issue_chain()
-            spec: IssueSpec = chain.invoke(prompt)
+            spec: IssueSpec = invoke_cached("create_issue", get_llm_model(), chain, prompt, IssueSpec)
             # Ensure new product issues get backlog+prioritized at creation
             if "backlog" not in spec.labels:
                 spec.labels.append("backlog")
@@ -163,8 +258,7 @@ Produce a complete issue with: title, body, labels (always include 'backlog' and
             return f"Error producing structured issue: {e}"
 
         body = _format_issue_body(spec)
-        create_tool = CreateIssueTool(repo_config=self._repo_config)
-        result = create_tool._run(title=spec.title, body=body, labels=spec.labels)
+        result = _create_issue(self._repo_config, spec.title, body, spec.labels)
         logger.info("CreateStructuredIssueTool: successfully created issue from structured spec")
         return result
 
@@ -194,6 +288,15 @@ class EnrichIssueTool(BaseTool):
         super().__init__(**kwargs)
         self._repo_config = repo_config
         self._product_context = product_context or {}
+        # Precomputed for the same reason as CreateStructuredIssueTool: stable
+        # prompts across calls with identical context feed the LLM cache.
+        ctx = self._product_context
+        parts = []
+        if ctx.get("product_overview"):
+            parts.append(f"\nProduct Overview: {ctx['product_overview']}")
+        if ctx.get("product_goal"):
+            parts.append(f"\nProduct Goal: {ctx['product_goal']}")
+        self._context_block = "".join(parts)
 
     def _run(self, issue_number: int) -> str:
         from ai_army.chains.product_chains import enrich_issue_chain
@@ -201,7 +304,7 @@ class EnrichIssueTool(BaseTool):
 
         repo = _get_repo_from_config(self._repo_config)
         try:
-            issue = repo.get_issue(issue_number)
+            issue = get_issue_cached(repo, issue_number)
             label_names = [l.name for l in (issue.labels or [])]
             if "ready-for-breakdown" in label_names:
                 logger.info("EnrichIssueTool: issue #%s already has ready-for-breakdown, skipping", issue_number)
@@ -212,24 +315,25 @@ class EnrichIssueTool(BaseTool):
             logger.warning("Could not fetch issue #%s: %s", issue_number, e)
             return f"Error fetching issue #{issue_number}: {e}"
 
-        ctx = self._product_context
-        context_block = ""
-        if ctx.get("product_overview"):
-            context_block += f"\nProduct Overview: {ctx['product_overview']}"
-        if ctx.get("product_goal"):
-            context_block += f"\nProduct Goal: {ctx['product_goal']}"
-
         prompt = f"""Enrich this GitHub issue with acceptance criteria and technical notes.
 
-{context_block}
+{self._context_block}
 
 Issue #{issue_number}: {issue_title}
 Body: {issue_body}
 
 Produce acceptance_criteria (list of clear, testable criteria) and technical_notes (implementation hints)."""
         try:
+            from ai_army.chains.llm_cache import invoke_cached
+            from ai_army.config.llm_config import get_llm_model
+
             chain = enrich_issue_chain()
-            spec: EnrichIssueSpec = chain.invoke(prompt)
+            # updated_at in the key so an edited issue whose title/body render
+            # the same prompt is not served a stale enrichment.
+            updated_at = str(getattr(issue, "updated_at", "") or "")
+            spec: EnrichIssueSpec = invoke_cached(
+                "enrich_issue", get_llm_model(), chain, prompt, EnrichIssueSpec, version=updated_at
+            )
             logger.info("EnrichIssueTool: produced EnrichIssueSpec for issue #%s", issue_number)
         except Exception as e:
             logger.exception("EnrichIssueTool chain failed: %s", e)
@@ -244,9 +348,9 @@ Produce acceptance_criteria (list of clear, testable criteria) and technical_not
             comment_parts.append(f"\n## Technical Notes\n{spec.technical_notes}")
         comment = "\n".join(comment_parts).strip()
 
-        update_tool = UpdateIssueTool(repo_config=self._repo_config)
-        result = update_tool._run(
-            issue_number=issue_number,
+        result = _update_issue(
+            self._repo_config,
+            issue_number,
             comment=comment,
             labels_to_add=["ready-for-breakdown"],
         )
@@ -284,7 +388,7 @@ class BreakdownAndCreateSubIssuesTool(BaseTool):
 
         repo = _get_repo_from_config(self._repo_config)
         try:
-            parent = repo.get_issue(parent_issue_number)
+            parent = get_issue_cached(repo, parent_issue_number)
             label_names = [l.name for l in (parent.labels or [])]
             if "broken-down" in label_names:
                 logger.info("BreakdownAndCreateSubIssuesTool: issue #%s already has broken-down, skipping", parent_issue_number)
@@ -319,8 +423,11 @@ Rules:
 Produce sub_tasks with title, body, label (frontend, backend, or fullstack), file_scope, depends_on, and priority for each sub-task.
 Set parent_issue to {parent_issue_number}."""
         try:
+            from ai_army.chains.llm_cache import invoke_cached
+            from ai_army.config.llm_config import get_llm_model
+
             chain = breakdown_chain()
-            spec: BreakdownSpec = chain.invoke(prompt)
+            spec: BreakdownSpec = invoke_cached("breakdown", get_llm_model(), chain, prompt, BreakdownSpec)
             logger.info(
                 "BreakdownAndCreateSubIssuesTool: produced %d sub-tasks for issue #%s",
                 len(spec.sub_tasks),
@@ -361,40 +468,73 @@ Set parent_issue to {parent_issue_number}."""
                     )
                     sub_task.label = prior.label
 
-        update_tool = UpdateIssueTool(repo_config=self._repo_config)
-        created: list[str] = []
-        sub_issue_nums: list[int] = []
+        created: list[str] = [""] * len(spec.sub_tasks)
+        sub_issue_nums: list[int | None] = [None] * len(spec.sub_tasks)
+        parent_prefix = f"Parent: #{parent_issue_number}"
 
-        for index, st in enumerate(spec.sub_tasks):
-            depends_on_issue: int | None = None
-            if st.depends_on is not None and 0 <= st.depends_on < len(sub_issue_nums):
-                depends_on_issue = sub_issue_nums[st.depends_on]
+        def _create_sub_issue(index: int, st, depends_on_issue: int | None) -> tuple[int, int, str]:
             metadata_block = _format_issue_meta(
                 file_scope=st.file_scope,
                 depends_on=depends_on_issue,
                 priority=st.priority,
             )
-            body_parts = [f"Parent: #{parent_issue_number}", st.body.strip(), metadata_block]
+            body_parts = [parent_prefix, st.body.strip(), metadata_block]
             body = "\n\n".join(part for part in body_parts if part)
-            issue = repo.create_issue(title=st.title, body=body, labels=[st.label])
-            created.append(f"Created issue #{issue.number}: {st.title} (labels: ['{st.label}'])")
-            sub_issue_nums.append(issue.number)
-
-        if len(sub_issue_nums) == len(spec.sub_tasks):
-            sub_list = "\n".join(
-                f"- #{n} {st.title} ({st.label}) | scope={st.file_scope} | depends_on={st.depends_on} | priority={st.priority}"
-                for n, st in zip(sub_issue_nums, spec.sub_tasks, strict=True)
-            )
-        else:
-            sub_list = "\n".join(
-                f"- {st.title} ({st.label}) | scope={st.file_scope} | depends_on={st.depends_on} | priority={st.priority}"
-                for st in spec.sub_tasks
+            issue = call_with_retries(
+                "create_sub_issue", lambda: repo.create_issue(title=st.title, body=body, labels=[st.label])
             )
+            return index, issue.number, f"Created issue #{issue.number}: {st.title} (labels: ['{st.label}'])"
+
+        # Creation is pure network wait, so fan it out — but a dependent task's
+        # metadata embeds its prerequisite's issue number, so create in waves:
+        # everything whose dependency is already created goes in parallel.
+        pending = list(enumerate(spec.sub_tasks))
+        while pending:
+            ready = [
+                (index, st)
+                for index, st in pending
+                if st.depends_on is None or sub_issue_nums[st.depends_on] is not None
+            ]
+            if not ready:
+                # The earlier-task-only validation should make this
+                # unreachable, but never let the loop spin on a dependency
+                # slot that cannot fill: flatten the rest and keep going.
+                logger.warning(
+                    "BreakdownAndCreateSubIssuesTool: no runnable sub-tasks among %d pending; dropping dependency links",
+                    len(pending),
+                )
+                for _, st in pending:
+                    st.depends_on = None
+                ready = list(pending)
+            futures = [
+                IO_POOL.submit(
+                    _create_sub_issue,
+                    index,
+                    st,
+                    sub_issue_nums[st.depends_on] if st.depends_on is not None else None,
+                )
+                for index, st in ready
+            ]
+            for future in futures:
+                index, issue_number, message = future.result()
+                sub_issue_nums[index] = issue_number
+                created[index] = message
+            done = {index for index, _ in ready}
+            pending = [(index, st) for index, st in pending if index not in done]
+
+        # Numbers come straight from the create responses, so every slot is
+        # filled once the waves drain (a failed create raises out of _run).
+        sub_list = "\n".join(
+            f"- #{n} {st.title} ({st.label}) | scope={st.file_scope} | depends_on={st.depends_on} | priority={st.priority}"
+            for n, st in zip(sub_issue_nums, spec.sub_tasks, strict=True)
+        )
         comment = f"[Team Lead]\n\nBroken down into sub-tasks:\n{sub_list}"
-        update_tool._run(
-            issue_number=parent_issue_number,
+        _update_issue(
+            self._repo_config,
+            parent_issue_number,
             comment=comment,
             labels_to_add=["broken-down"],
+            issue=parent,
         )
         logger.info(
             "BreakdownAndCreateSubIssuesTool: created %d sub-issues for #%s, marked parent broken-down",
@@ -436,33 +576,13 @@ class UpdateIssueTool(BaseTool):
         labels_to_remove: list[str] | None = None,
         assignee: str = "",
     ) -> str:
-        labels_to_add = labels_to_add or []
-        labels_to_remove = labels_to_remove or []
-        try:
-            repo = _get_repo_from_config(self._repo_config)
-            issue = repo.get_issue(issue_number)
-        except Exception as e:
-            logger.exception("UpdateIssueTool: could not fetch issue #%s: %s", issue_number, e)
-            raise
-        actions = []
-        if comment:
-            issue.create_comment(comment)
-            actions.append("added comment")
-        for label in labels_to_add:
-            issue.add_to_labels(label)
-            actions.append(f"added label '{label}'")
-        for label in labels_to_remove:
-            issue.remove_from_labels(label)
-            actions.append(f"removed label '{label}'")
-        if assignee:
-            issue.add_to_assignees(assignee)
-            actions.append(f"assigned to {assignee}")
-        if actions:
-            logger.info("UpdateIssueTool: updated issue #%s - %s", issue_number, ", ".join(actions))
-        return (
-            f"Updated issue #{issue_number}: {', '.join(actions) or 'no changes'}"
-            if actions
-            else "No updates applied"
+        return _update_issue(
+            self._repo_config,
+            issue_number,
+            comment=comment,
+            labels_to_add=labels_to_add,
+            labels_to_remove=labels_to_remove,
+            assignee=assignee,
         )
 
 
@@ -494,17 +614,43 @@ class ListOpenIssuesTool(BaseTool):
         try:
             labels = labels or []
             repo = _get_repo_from_config(self._repo_config)
-            raw = repo.get_issues(state="open", labels=labels) if labels else repo.get_issues(state="open")
-            issues = list(raw)[:limit]
-            result = []
-            for i in issues:
-                if i.pull_request:
-                    continue
-                label_names = [l.name for l in (i.labels or [])]
-                result.append(f"#{i.number}: {i.title} | labels: {label_names}")
-            count = len(result)
-            logger.info("ListOpenIssuesTool: found %d open issues (labels=%s)", count, labels or "all")
-            return "\n".join(result) if result else "No matching open issues found"
+
+            def _list() -> str:
+                result = []
+                # The Search API excludes PRs server-side ('is:issue'), so a repo
+                # where most open items are PRs doesn't overfetch pages of them.
+                client = _client_for_repo(repo)
+                if client is not None:
+                    try:
+                        q = f"repo:{repo.full_name} is:issue is:open" + "".join(
+                            f' label:"{label}"' for label in labels
+                        )
+                        for i in islice(client.search_issues(q), limit):
+                            result.append(f"#{i.number}: {i.title} | labels: {_label_names(i)}")
+                        logger.info(
+                            "ListOpenIssuesTool: found %d open issues via search (labels=%s)",
+                            len(result), labels or "all",
+                        )
+                        return "\n".join(result) if result else "No matching open issues found"
+                    except Exception as e:
+                        # Search has its own 30 req/min budget; fall back to listing.
+                        logger.debug("ListOpenIssuesTool: search fallback to listing: %s", e)
+                        result = []
+                raw = repo.get_issues(state="open", labels=labels) if labels else repo.get_issues(state="open")
+                # Count issues, not listing rows: the endpoint interleaves PRs, so
+                # slicing the paginator at `limit` would under-deliver after filtering.
+                for i in raw:
+                    if i.pull_request:
+                        continue
+                    result.append(f"#{i.number}: {i.title} | labels: {_label_names(i)}")
+                    if len(result) >= limit:
+                        break
+                logger.info("ListOpenIssuesTool: found %d open issues (labels=%s)", len(result), labels or "all")
+                return "\n".join(result) if result else "No matching open issues found"
+
+            full_name = getattr(repo, "full_name", None)
+            key = ("open_issues", full_name, tuple(sorted(labels)), limit) if full_name else None
+            return cached_listing(key, _list)
         except Exception as e:
             logger.exception("ListOpenIssuesTool failed: %s", e)
             return f"Error listing issues: {e}"
@@ -538,17 +684,22 @@ class ListClosedIssuesTool(BaseTool):
         try:
             labels = labels or []
             repo = _get_repo_from_config(self._repo_config)
-            raw = repo.get_issues(state="closed", labels=labels) if labels else repo.get_issues(state="closed")
-            issues = list(raw)[:limit]
-            result = []
-            for i in issues:
-                if i.pull_request:
-                    continue
-                label_names = [l.name for l in (i.labels or [])]
-                result.append(f"#{i.number}: {i.title} | labels: {label_names}")
-            count = len(result)
-            logger.info("ListClosedIssuesTool: found %d closed issues (labels=%s)", count, labels or "all")
-            return "\n".join(result) if result else "No matching closed issues found"
+
+            def _list() -> str:
+                raw = repo.get_issues(state="closed", labels=labels) if labels else repo.get_issues(state="closed")
+                result = []
+                for i in raw:
+                    if i.pull_request:
+                        continue
+                    result.append(f"#{i.number}: {i.title} | labels: {_label_names(i)}")
+                    if len(result) >= limit:
+                        break
+                logger.info("ListClosedIssuesTool: found %d closed issues (labels=%s)", len(result), labels or "all")
+                return "\n".join(result) if result else "No matching closed issues found"
+
+            full_name = getattr(repo, "full_name", None)
+            key = ("closed_issues", full_name, tuple(sorted(labels)), limit) if full_name else None
+            return cached_listing(key, _list)
         except Exception as e:
             logger.exception("ListClosedIssuesTool failed: %s", e)
             return f"Error listing closed issues: {e}"
@@ -2,17 +2,44 @@
 
 import re
 import logging
+from itertools import islice
 from typing import Type
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from ai_army.config.settings import GitHubRepoConfig
-from ai_army.tools.github_helpers import _get_repo_from_config, _refresh_mergeable
-from ai_army.tools.github_issue_tools import UpdateIssueTool
+from ai_army.tools.github_helpers import (
+    _get_repo_from_config,
+    _refresh_mergeable,
+    cached_listing,
+    call_with_retries,
+    get_pull_cached,
+    invalidate_issue_counts,
+)
+from ai_army.tools.github_issue_tools import _update_issue
 
 logger = logging.getLogger(__name__)
 
+_CLOSES_RE = re.compile(r"(?:Closes|Fixes)\s*#(\d+)", re.IGNORECASE)
+
+
+def _merge_pull(
+    repo_config: GitHubRepoConfig | None,
+    pr_number: int,
+    merge_method: str = "merge",
+    commit_message: str = "",
+) -> str:
+    """Merge a PR directly. Internal fast path: no tool/Pydantic construction."""
+    repo = _get_repo_from_config(repo_config)
+    pr = get_pull_cached(repo, pr_number)
+    call_with_retries(
+        "merge_pull", lambda: pr.merge(merge_method=merge_method, commit_message=commit_message or None)
+    )
+    invalidate_issue_counts()
+    logger.info("MergePullRequestTool: merged PR #%s using %s", pr_number, merge_method)
+    return f"Merged PR #{pr_number} using {merge_method}"
+
 
 class CreatePullRequestInput(BaseModel):
     """Input schema for CreatePullRequestTool."""
@@ -49,7 +76,10 @@ class CreatePullRequestTool(BaseTool):
             body = f"{body}\n\nCloses #{issue_number}".strip() if body else f"Closes #{issue_number}"
         try:
             repo = _get_repo_from_config(self._repo_config)
-            pr = repo.create_pull(title=title, body=body, head=head, base=base)
+            pr = call_with_retries(
+                "create_pull", lambda: repo.create_pull(title=title, body=body, head=head, base=base)
+            )
+            invalidate_issue_counts()
             logger.info("CreatePullRequestTool: created PR #%s %s (%s -> %s)", pr.number, title, head, base)
             return f"Created PR #{pr.number}: {title} ({head} -> {base})"
         except Exception as e:
@@ -77,12 +107,25 @@ class ListPullRequestsTool(BaseTool):
 
     def _run(self, state: str = "open", limit: int = 20) -> str:
         repo = _get_repo_from_config(self._repo_config)
-        prs = list(repo.get_pulls(state=state)[:limit])
-        result = []
-        for pr in prs:
-            result.append(f"#{pr.number}: {pr.title} | {pr.head.ref} -> {pr.base.ref} | {pr.user.login}")
-        logger.info("ListPullRequestsTool: found %d PRs (state=%s)", len(result), state)
-        return "\n".join(result) if result else "No pull requests found"
+
+        def _list() -> str:
+            result = []
+            for pr in repo.get_pulls(state=state)[:limit]:
+                # Everything for the summary line is already in the listing payload;
+                # read it as plain dicts instead of lazy-wrapping head/base/user.
+                raw = getattr(pr, "raw_data", None)
+                if isinstance(raw, dict):
+                    result.append(
+                        f"#{raw['number']}: {raw['title']} | {raw['head']['ref']} -> {raw['base']['ref']} | {raw['user']['login']}"
+                    )
+                else:
+                    result.append(f"#{pr.number}: {pr.title} | {pr.head.ref} -> {pr.base.ref} | {pr.user.login}")
+            logger.info("ListPullRequestsTool: found %d PRs (state=%s)", len(result), state)
+            return "\n".join(result) if result else "No pull requests found"
+
+        full_name = getattr(repo, "full_name", None)
+        key = ("pulls", full_name, state, limit) if full_name else None
+        return cached_listing(key, _list)
 
 
 class GetPullRequestDetailsInput(BaseModel):
@@ -108,15 +151,18 @@ class GetPullRequestDetailsTool(BaseTool):
     def _run(self, pr_number: int) -> str:
         repo = _get_repo_from_config(self._repo_config)
         try:
-            pr = repo.get_pull(pr_number)
+            pr = get_pull_cached(repo, pr_number)
         except Exception as e:
             logger.warning("GetPullRequestDetailsTool: could not fetch PR #%s: %s", pr_number, e)
             return f"Error fetching PR #{pr_number}: {e}"
         mergeable = _refresh_mergeable(repo, pr_number)
-        files_list = list(pr.get_files())
-        files_summary = "\n".join(f"- {f.filename}" for f in files_list[:50])
-        if len(files_list) > 50:
-            files_summary += f"\n... and {len(files_list) - 50} more"
+        # Only the first 50 names are shown; stop paginating there and take the
+        # exact total from the PR object instead of walking every file page.
+        total_files = pr.changed_files
+        file_lines = [f"- {f.filename}" for f in islice(pr.get_files(), 50)]
+        if total_files > 50:
+            file_lines.append(f"... and {total_files - 50} more")
+        files_summary = "\n".join(file_lines)
         issue_num = _extract_closes_issue(pr.body or "")
         issue_context = ""
         if issue_num:
@@ -162,13 +208,13 @@ class ReviewPullRequestTool(BaseTool):
 
         repo = _get_repo_from_config(self._repo_config)
         try:
-            pr = repo.get_pull(pr_number)
+            pr = get_pull_cached(repo, pr_number)
             pr_title = pr.title
             pr_body = pr.body or ""
-            files_list = list(pr.get_files())
-            files_summary = "\n".join(f"- {f.filename}" for f in files_list[:30])
-            if len(files_list) > 30:
-                files_summary += "\n..."
+            file_lines = [f"- {f.filename}" for f in islice(pr.get_files(), 30)]
+            if pr.changed_files > 30:
+                file_lines.append("...")
+            files_summary = "\n".join(file_lines)
         except Exception as e:
             logger.warning("ReviewPullRequestTool: could not fetch PR #%s: %s", pr_number, e)
             return f"Error fetching PR #{pr_number}: {e}"
@@ -185,20 +231,27 @@ Files changed:
 Decide: merge (if looks good) or request_changes (if feedback needed).
 Provide feedback_points (file, line, comment) for any issues. Prefer merging when in doubt."""
         try:
+            from ai_army.chains.llm_cache import invoke_cached
+            from ai_army.config.llm_config import get_llm_model
+
             chain = review_pr_chain()
-            spec: ReviewSpec = chain.invoke(prompt)
+            # Keyed on the head SHA: new commits to the same branch leave the
+            # prompt byte-identical (title/body/file names), and a replayed
+            # request_changes would wedge the review loop forever.
+            head_sha = getattr(getattr(pr, "head", None), "sha", "") or ""
+            spec: ReviewSpec = invoke_cached(
+                "review_pr", get_llm_model(), chain, prompt, ReviewSpec, version=head_sha
+            )
             logger.info("ReviewPullRequestTool: decision=%s for PR #%s", spec.decision, pr_number)
         except Exception as e:
             logger.exception("ReviewPullRequestTool chain failed: %s", e)
             return f"Error producing review: {e}"
 
         if spec.decision == "merge":
-            merge_tool = MergePullRequestTool(repo_config=self._repo_config)
-            result = merge_tool._run(pr_number=pr_number)
+            result = _merge_pull(self._repo_config, pr_number)
             issue_num = _extract_closes_issue(pr_body)
             if issue_num:
-                update_tool = UpdateIssueTool(repo_config=self._repo_config)
-                update_tool._run(issue_number=issue_num, labels_to_add=["done"])
+                _update_issue(self._repo_config, issue_num, labels_to_add=["done"])
                 logger.info("ReviewPullRequestTool: merged PR #%s, set done on issue #%s", pr_number, issue_num)
                 result += f" | Set 'done' on issue #{issue_num}"
             else:
@@ -213,9 +266,9 @@ Provide feedback_points (file, line, comment) for any issues. Prefer merging whe
         comment = "\n".join(comment_parts)
         issue_num = _extract_closes_issue(pr_body)
         if issue_num:
-            update_tool = UpdateIssueTool(repo_config=self._repo_config)
-            result = update_tool._run(
-                issue_number=issue_num,
+            result = _update_issue(
+                self._repo_config,
+                issue_num,
                 comment=f"[QA Agent]\n\nPR #{pr_number} feedback:\n\n{comment}",
             )
             logger.info("ReviewPullRequestTool: added feedback to issue #%s for PR #%s", issue_num, pr_number)
@@ -227,7 +280,7 @@ def _extract_closes_issue(body: str) -> int | None:
     """Extract issue number from Closes #N or Fixes #N in PR body."""
     if not body:
         return None
-    match = re.search(r"(?:Closes|Fixes)\s*#(\d+)", body, re.IGNORECASE)
+    match = _CLOSES_RE.search(body)
     return int(match.group(1)) if match else None
 
 
@@ -256,11 +309,7 @@ class MergePullRequestTool(BaseTool):
         merge_method: str = "merge",
         commit_message: str = "",
     ) -> str:
-        repo = _get_repo_from_config(self._repo_config)
-        pr = repo.get_pull(pr_number)
-        pr.merge(merge_method=merge_method, commit_message=commit_message or None)
-        logger.info("MergePullRequestTool: merged PR #%s using %s", pr_number, merge_method)
-        return f"Merged PR #{pr_number} using {merge_method}"
+        return _merge_pull(self._repo_config, pr_number, merge_method, commit_message)
 
 
 class CreateBranchInput(BaseModel):
@@ -285,6 +334,8 @@ class CreateBranchTool(BaseTool):
         repo = _get_repo_from_config(self._repo_config)
         branch = repo.get_branch(from_ref)
         sha = branch.commit.sha
-        ref = repo.create_git_ref(ref=f"refs/heads/{branch_name}", sha=sha)
+        call_with_retries(
+            "create_git_ref", lambda: repo.create_git_ref(ref=f"refs/heads/{branch_name}", sha=sha)
+        )
         logger.info("CreateBranchTool: created branch '%s' from %s", branch_name, from_ref)
         return f"Created branch '{branch_name}' from {from_ref}"
@@ -34,17 +34,30 @@ from ai_army.tools.github_pr_tools import (
 )
 
 
+_TOOLS_CACHE: dict[tuple[str, str] | None, tuple] = {}
+
+
 def create_github_tools(repo_config: GitHubRepoConfig | None = None) -> tuple:
-    """Create GitHub tools bound to a specific repo config."""
-    return (
-        CreateIssueTool(repo_config=repo_config),
-        UpdateIssueTool(repo_config=repo_config),
-        ListOpenIssuesTool(repo_config=repo_config),
-        CreatePullRequestTool(repo_config=repo_config),
-        ListPullRequestsTool(repo_config=repo_config),
-        MergePullRequestTool(repo_config=repo_config),
-        CreateBranchTool(repo_config=repo_config),
-    )
+    """Create GitHub tools bound to a specific repo config.
+
+    The tuple is memoized per (token, repo): the tools are stateless beyond
+    their repo binding, and crews re-request tool sets per task, so repeat
+    calls skip seven BaseTool/Pydantic constructions.
+    """
+    key = (repo_config.token, repo_config.repo) if repo_config else None
+    tools = _TOOLS_CACHE.get(key)
+    if tools is None:
+        tools = (
+            CreateIssueTool(repo_config=repo_config),
+            UpdateIssueTool(repo_config=repo_config),
+            ListOpenIssuesTool(repo_config=repo_config),
+            CreatePullRequestTool(repo_config=repo_config),
+            ListPullRequestsTool(repo_config=repo_config),
+            MergePullRequestTool(repo_config=repo_config),
+            CreateBranchTool(repo_config=repo_config),
+        )
+        _TOOLS_CACHE[key] = tools
+    return tools
 
 
 __all__ = [
@@ -3,7 +3,11 @@
 All paths are relative to the repo root. Scoped to repo_path to prevent escape.
 """
 
+import heapq
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Type
 
@@ -13,26 +17,66 @@ from pydantic import BaseModel, Field
 logger = logging.getLogger(__name__)
 
 
+_ROOT_CACHE: dict[str, Path] = {}
+
+
 def _repo_root(override: str | None) -> Path | None:
-    """Resolve repo root. Return None if not set or not a git repo."""
+    """Resolve repo root. Return None if not set or not a git repo.
+
+    Resolution costs several stat-class syscalls; repo paths never move
+    within a process, so successes are cached per override string. Misses
+    are re-checked each call (the clone may appear later).
+    """
     if not override or not override.strip():
         return None
+    cached = _ROOT_CACHE.get(override)
+    if cached is not None:
+        return cached
     p = Path(override).expanduser().resolve()
     if not (p / ".git").exists():
         return None
+    _ROOT_CACHE[override] = p
     return p
 
 
+@lru_cache(maxsize=1024)
+def _resolve_safe_cached(root_str: str, relative_path: str) -> str:
+    """Resolve and containment-check a path, returning "" when it escapes.
+
+    Resolution walks every component with realpath syscalls, and agent
+    sessions re-pass the same relative paths many times; string keys and
+    results keep the cache hashable. Cleared after writes, since a new
+    symlink could change how a path resolves. Pure os.path string ops —
+    no intermediate Path objects — since root_str is already resolved.
+    """
+    full = os.path.realpath(os.path.join(root_str, relative_path.strip().lstrip("/")))
+    try:
+        if os.path.commonpath((full, root_str)) != root_str:
+            return ""
+    except ValueError:
+        return ""
+    return full
+
+
 def _resolve_safe(repo_root: Path, relative_path: str) -> Path | None:
     """Resolve path under repo root. Return None if path escapes (e.g. ..)."""
     if not relative_path or relative_path.strip() == "":
         return repo_root
-    path = (repo_root / relative_path.strip().lstrip("/")).resolve()
-    try:
-        path.relative_to(repo_root)
-    except ValueError:
-        return None
-    return path
+    resolved = _resolve_safe_cached(str(repo_root), relative_path)
+    return Path(resolved) if resolved else None
+
+
+# Heavy, machine-generated directories that only add noise to listings and
+# structure overviews (and can hold hundreds of thousands of entries).
+_PRUNE_DIRS = frozenset(
+    {".git", "node_modules", "__pycache__", ".venv", "venv", "dist", "build", ".mypy_cache", ".pytest_cache"}
+)
+
+# Binary artifacts the agent cannot read anyway; surfacing them in listings
+# only spends tokens. Checked by extension so no file content is touched.
+_BINARY_EXTENSIONS = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".ico", ".pdf", ".zip", ".tar", ".gz", ".whl", ".so", ".dylib", ".pyc", ".woff", ".woff2"}
+)
 
 
 # --- ListDirTool ---
@@ -46,6 +90,7 @@ class ListDirInput(BaseModel):
         description="Directory path relative to repo root (e.g. 'src', 'src/components'). Use '.' for repo root.",
     )
     max_entries: int = Field(default=100, ge=1, le=500, description="Max files/dirs to return (avoid huge listings)")
+    include_hidden: bool = Field(default=False, description="Include dotfiles and hidden directories in the listing")
 
 
 class ListDirTool(BaseTool):
@@ -62,7 +107,7 @@ class ListDirTool(BaseTool):
         super().__init__(**kwargs)
         self._repo_path = repo_path
 
-    def _run(self, path: str = ".", max_entries: int = 100) -> str:
+    def _run(self, path: str = ".", max_entries: int = 100, include_hidden: bool = False) -> str:
         root = _repo_root(self._repo_path)
         if not root:
             logger.warning("ListDirTool: repo path not configured")
@@ -74,26 +119,63 @@ class ListDirTool(BaseTool):
         if not resolved.is_dir():
             logger.warning("ListDirTool: not a directory: %s", path)
             return f"Not a directory: {path}"
-        entries = []
         try:
-            for i, entry in enumerate(sorted(resolved.iterdir())):
-                if i >= max_entries:
-                    entries.append(f"... and more (truncated at {max_entries})")
-                    break
-                name = entry.name
-                if entry.is_dir():
-                    entries.append(f"{name}/")
-                else:
-                    entries.append(name)
-            logger.info("ListDirTool: listed %s (%d entries)", path, len(entries))
+            # DirEntry.is_dir(follow_symlinks=False) is answered from the
+            # directory read itself, so no per-entry stat.
+            # Filter machine-generated noise, binary artifacts, and (unless
+            # asked for) dotfiles so listings spend their entry budget on
+            # files the agent can actually work with. An ignored directory
+            # can still be listed by passing its path explicitly.
+            with os.scandir(resolved) as it:
+                raw = []
+                for entry in it:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    # Prune and extension checks are type-scoped: a regular
+                    # file named "build" or a directory named "x.gz" still shows.
+                    if is_dir and entry.name in _PRUNE_DIRS:
+                        continue
+                    if not include_hidden and entry.name.startswith("."):
+                        continue
+                    if not is_dir and os.path.splitext(entry.name)[1].lower() in _BINARY_EXTENSIONS:
+                        continue
+                    raw.append((entry.name, is_dir))
         except OSError as e:
             logger.warning("ListDirTool: error listing %s: %s", path, e)
             return f"Error listing directory: {e}"
+        truncated = len(raw) > max_entries
+        # Only the first max_entries names matter; pick them without sorting
+        # the whole directory when it is huge.
+        shown = heapq.nsmallest(max_entries, raw) if truncated else sorted(raw)
+        entries = [f"{name}/" if is_dir else name for name, is_dir in shown]
+        if truncated:
+            entries.append(f"... and more (truncated at {max_entries})")
+        logger.info("ListDirTool: listed %s (%d entries)", path, len(entries))
         return "\n".join(entries) if entries else "(empty)"
 
 
 # --- RepoStructureTool ---
 
+# Sibling directories are independent getdents streams, so scanning them
+# concurrently overlaps the per-directory syscall latency. A small pool is
+# enough: the walk is shallow and each scan is short.
+_WALK_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="repo-walk")
+
+
+def _scan_sorted(dir_path: Path) -> list[tuple[str, bool]]:
+    """Scandir with pruning, directories first; empty on unreadable dirs."""
+    try:
+        entries = []
+        with os.scandir(dir_path) as it:
+            for e in it:
+                is_dir = e.is_dir(follow_symlinks=False)
+                if is_dir and e.name in _PRUNE_DIRS:
+                    continue  # only prune directories; files may share the name
+                entries.append((e.name, is_dir))
+        entries.sort(key=lambda item: (not item[1], item[0].lower()))
+        return entries
+    except OSError:
+        return []
+
 
 class RepoStructureInput(BaseModel):
     """Input for RepoStructureTool."""
@@ -120,23 +202,32 @@ class RepoStructureTool(BaseTool):
         if not root:
             logger.warning("RepoStructureTool: repo path not configured")
             return "Repo path not configured. Cannot get structure."
-        lines = []
-
-        def walk(dir_path: Path, prefix: str, depth: int) -> None:
-            if depth <= 0:
+        # Breadth-first prefetch: all sibling directories of a level are
+        # scanned in parallel, then the tree is rendered sequentially from the
+        # collected listings so the output order stays deterministic.
+        listings: dict[Path, list[tuple[str, bool]]] = {}
+        level = [root]
+        for depth in range(max_depth):
+            for dir_path, entries in zip(level, _WALK_POOL.map(_scan_sorted, level)):
+                listings[dir_path] = entries
+            if depth + 1 >= max_depth:
+                break
+            level = [d / name for d in level for name, is_dir in listings[d] if is_dir]
+
+        lines: list[str] = []
+
+        def render(dir_path: Path, prefix: str) -> None:
+            entries = listings.get(dir_path)
+            if entries is None:
                 return
-            try:
-                entries = sorted(dir_path.iterdir(), key=lambda e: (e.is_file(), e.name.lower()))
-            except OSError:
-                return
-            for i, entry in enumerate(entries):
+            for i, (name, is_dir) in enumerate(entries):
                 is_last = i == len(entries) - 1
                 branch = "└── " if is_last else "├── "
-                lines.append(prefix + branch + entry.name + ("/" if entry.is_dir() else ""))
-                if entry.is_dir() and depth > 1:
-                    extension = "    " if is_last else "│   "
-                    walk(entry, prefix + extension, depth - 1)
-        walk(root, "", max_depth)
+                lines.append(prefix + branch + name + ("/" if is_dir else ""))
+                if is_dir:
+                    render(dir_path / name, prefix + ("    " if is_last else "│   "))
+
+        render(root, "")
         return "\n".join(lines) if lines else "(empty repo)"
 
 
@@ -177,15 +268,40 @@ class ReadFileTool(BaseTool):
             logger.warning("ReadFileTool: not a file or not found: %s", path)
             return f"Not a file or not found: {path}"
         try:
-            text = resolved.read_text(encoding="utf-8", errors="replace")
-            lines = text.splitlines()
-            truncated = len(lines) > max_lines
-            logger.info("ReadFileTool: read %s (%d lines%s)", path, len(lines), ", truncated" if truncated else "")
+            # Count line endings on raw bytes (bytes.count is C-level memchr)
+            # and decode only what is returned: a truncated read of a huge
+            # file never pays for decoding the discarded tail.
+            with resolved.open("rb") as f:
+                head = bytearray()
+                newlines = 0
+                ends_with_newline = False
+                while newlines <= max_lines:
+                    chunk = f.read(65536)
+                    if not chunk:
+                        break
+                    head += chunk
+                    newlines += chunk.count(b"\n")
+                    ends_with_newline = chunk.endswith(b"\n")
+                total_lines = newlines
+                while True:
+                    chunk = f.read(65536)
+                    if not chunk:
+                        break
+                    total_lines += chunk.count(b"\n")
+                    ends_with_newline = chunk.endswith(b"\n")
+            if head and not ends_with_newline:
+                total_lines += 1
+            remaining = max(total_lines - max_lines, 0)
+            logger.info(
+                "ReadFileTool: read %s (%d lines%s)", path, total_lines, ", truncated" if remaining else ""
+            )
         except OSError as e:
             logger.warning("ReadFileTool: error reading %s: %s", path, e)
             return f"Error reading file: {e}"
-        if len(lines) > max_lines:
-            return "\n".join(lines[:max_lines]) + f"\n\n... truncated ({len(lines) - max_lines} more lines)"
+        text = bytes(head).decode("utf-8", errors="replace")
+        if remaining:
+            kept = text.split("\n", max_lines)[:max_lines]
+            return "\n".join(kept).rstrip("\n") + f"\n\n... truncated ({remaining} more lines)"
         return text
 
 
@@ -226,9 +342,13 @@ class WriteFileTool(BaseTool):
         try:
             if create_dirs:
                 resolved.parent.mkdir(parents=True, exist_ok=True)
-            resolved.write_text(content, encoding="utf-8")
-            logger.info("WriteFileTool: wrote %s (%d chars)", path, len(content))
+            # Encode once and hand the bytes straight to the OS, skipping the
+            # TextIOWrapper's incremental encoding and Python-level buffering.
+            data = content.encode("utf-8")
+            resolved.write_bytes(data)
+            _resolve_safe_cached.cache_clear()
+            logger.info("WriteFileTool: wrote %s (%d bytes)", path, len(data))
         except OSError as e:
             logger.warning("WriteFileTool: error writing %s: %s", path, e)
             return f"Error writing file: {e}"
-        return f"Wrote {path} ({len(content)} chars)"
+        return f"Wrote {path} ({len(data)} bytes)"
@@ -1,7 +1,8 @@
 """Search codebase tool - semantic search over indexed repo."""
 
+import hashlib
+import io
 import logging
-from pathlib import Path
 from typing import Type
 
 from crewai.tools import BaseTool
@@ -9,21 +10,12 @@ from pydantic import BaseModel, Field
 
 from ai_army.config.settings import GitHubRepoConfig
 from ai_army.rag.search import query_codebase
-from ai_army.tools.github_helpers import _get_repo_from_config
+from ai_army.tools.github_helpers import _get_repo_from_config, get_issue_cached
+from ai_army.tools.repo_file_tools import _repo_root
 
 logger = logging.getLogger(__name__)
 
 
-def _repo_root(override: str | None) -> Path | None:
-    """Resolve repo root. Return None if not set or not a git repo."""
-    if not override or not override.strip():
-        return None
-    p = Path(override).expanduser().resolve()
-    if not (p / ".git").exists():
-        return None
-    return p
-
-
 class SearchCodebaseInput(BaseModel):
     """Input for SearchCodebaseTool."""
 
@@ -58,6 +50,10 @@ class SearchCodebaseTool(BaseTool):
         super().__init__(**kwargs)
         self._repo_path = repo_path
         self._repo_config = repo_config
+        # Agent tasks repeat the same queries (issue title/body); each repeat
+        # would otherwise re-run transformer inference. Keyed on a query
+        # digest to keep long queries out of the key itself.
+        self._search_cache: dict[tuple[str, bytes, int], str] = {}
 
     def _run(
         self,
@@ -74,7 +70,9 @@ class SearchCodebaseTool(BaseTool):
         if not search_query and issue_number and self._repo_config:
             try:
                 repo = _get_repo_from_config(self._repo_config)
-                issue = repo.get_issue(issue_number)
+                # ETag-revalidated fetch: an unchanged issue costs a 304
+                # instead of a full payload round-trip.
+                issue = get_issue_cached(repo, issue_number)
                 search_query = f"{issue.title}\n{issue.body or ''}".strip()
             except Exception as e:
                 logger.warning("Failed to fetch issue #%s: %s", issue_number, e)
@@ -84,6 +82,16 @@ class SearchCodebaseTool(BaseTool):
             logger.warning("SearchCodebaseTool: no query provided")
             return "Provide a query or issue_number to search."
 
+        cache_key = (
+            str(root),
+            hashlib.blake2b(search_query.encode(), digest_size=16).digest(),
+            max_results,
+        )
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            logger.info("[RAG] search cache hit | repo=%s query_len=%d", root.name, len(search_query))
+            return cached
+
         logger.info("[RAG] search | repo=%s issue=%s query_len=%d", root.name, issue_number, len(search_query))
         response = query_codebase(root, search_query, top_k=max_results)
         if not response.results:
@@ -102,13 +110,21 @@ class SearchCodebaseTool(BaseTool):
             response.retrieval_mode,
             response.snapshot_version or "-",
         )
-        lines = [
-            f"Search mode: {response.retrieval_mode} | snapshot: {response.snapshot_version or 'n/a'}"
-        ]
+        # Write straight into one growable buffer instead of building a list
+        # of per-result strings and joining: with multi-KB snippets that
+        # avoids allocating every intermediate piece twice.
+        buf = io.StringIO()
+        buf.write(f"Search mode: {response.retrieval_mode} | snapshot: {response.snapshot_version or 'n/a'}")
         for r in response.results:
-            fp = r.get("file_path", "")
-            start = r.get("start_line", 0)
-            end = r.get("end_line", 0)
-            snippet = r.get("snippet", "")
-            lines.append(f"{fp} (L{start}-{end}):\n{snippet}\n")
-        return "\n---\n".join(lines)
+            buf.write("\n---\n")
+            buf.write(r.get("file_path", ""))
+            buf.write(f" (L{r.get('start_line', 0)}-{r.get('end_line', 0)}):\n")
+            buf.write(r.get("snippet", ""))
+            buf.write("\n")
+        output = buf.getvalue()
+        # Only successful searches are cached; empty results may just mean the
+        # index is still building. Bounded so a long-lived tool cannot grow.
+        if len(self._search_cache) >= 64:
+            self._search_cache.pop(next(iter(self._search_cache)))
+        self._search_cache[cache_key] = output
+        return output
@@ -0,0 +1,80 @@
+"""Tests for the LLM disk cache - hit/miss, version keys, and corrupt entries."""
+
+from pydantic import BaseModel
+
+from ai_army.chains import llm_cache
+from ai_army.chains.llm_cache import invoke_cached
+
+
+class _Spec(BaseModel):
+    value: str
+
+
+class _CountingChain:
+    """Stands in for a structured chain; counts real invocations."""
+
+    def __init__(self, result: _Spec):
+        self.result = result
+        self.calls = 0
+
+    def invoke(self, prompt: str) -> _Spec:
+        self.calls += 1
+        return self.result
+
+
+def _use_tmp_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(llm_cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr("ai_army.chains.llm_cache.settings.llm_cache_enabled", True)
+
+
+def test_invoke_cached_miss_then_hit(monkeypatch, tmp_path):
+    """First call invokes the chain and persists; repeat call is a disk read."""
+    _use_tmp_cache(monkeypatch, tmp_path)
+    chain = _CountingChain(_Spec(value="out"))
+
+    first = invoke_cached("test_chain", "model-a", chain, "same prompt", _Spec)
+    second = invoke_cached("test_chain", "model-a", chain, "same prompt", _Spec)
+
+    assert first.value == second.value == "out"
+    assert chain.calls == 1
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_invoke_cached_version_busts_stale_entries(monkeypatch, tmp_path):
+    """A new version (PR head SHA, issue updated_at) must not replay old output."""
+    _use_tmp_cache(monkeypatch, tmp_path)
+    chain = _CountingChain(_Spec(value="old"))
+
+    invoke_cached("review_pr", "model-a", chain, "same prompt", _Spec, version="sha-1")
+    chain.result = _Spec(value="new")
+    spec = invoke_cached("review_pr", "model-a", chain, "same prompt", _Spec, version="sha-2")
+
+    assert spec.value == "new"
+    assert chain.calls == 2
+
+
+def test_invoke_cached_corrupt_entry_falls_through(monkeypatch, tmp_path):
+    """Unparseable cache files are treated as misses, then overwritten."""
+    _use_tmp_cache(monkeypatch, tmp_path)
+    chain = _CountingChain(_Spec(value="fresh"))
+    path = llm_cache._cache_path("test_chain", "model-a", "prompt", "")
+    path.write_text("{not valid json", encoding="utf-8")
+
+    spec = invoke_cached("test_chain", "model-a", chain, "prompt", _Spec)
+
+    assert spec.value == "fresh"
+    assert chain.calls == 1
+    assert _Spec.model_validate_json(path.read_text(encoding="utf-8")).value == "fresh"
+
+
+def test_invoke_cached_disabled_skips_disk(monkeypatch, tmp_path):
+    """With LLM_CACHE_ENABLED=0 every call goes to the chain and nothing persists."""
+    monkeypatch.setattr(llm_cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr("ai_army.chains.llm_cache.settings.llm_cache_enabled", False)
+    chain = _CountingChain(_Spec(value="out"))
+
+    invoke_cached("test_chain", "model-a", chain, "prompt", _Spec)
+    invoke_cached("test_chain", "model-a", chain, "prompt", _Spec)
+
+    assert chain.calls == 2
+    assert list(tmp_path.glob("*.json")) == []
@@ -42,3 +42,25 @@ def test_should_index_path():
     assert should_index_path(Path("node_modules/x")) is False
     assert should_index_path(Path("foo/__pycache__/x.pyc")) is False
     assert should_index_path(Path("dist/out.js")) is False
+
+
+def test_chunk_file_nonstandard_line_separators():
+    """Regression: \f/\x85 inside a file must not shift boundary line numbers.
+
+    str.splitlines() treats form feed, NEL, etc. as line breaks while the
+    boundary regex only sees \n; chunking must count lines the same way.
+    """
+    content = (
+        "def foo():\n"
+        "    return 1\n"
+        "\x0c\n"
+        "class Bar:\n"
+        "    def baz(self):\n"
+        "        label = 'a\x85b'\n"
+        "        pass\n"
+    )
+    chunks = chunk_file("weird.py", content)
+    assert [c.symbol_name for c in chunks] == ["foo", "Bar", "baz"]
+    assert (chunks[0].start_line, chunks[0].end_line) == (1, 3)
+    assert (chunks[1].start_line, chunks[1].end_line) == (4, 4)
+    assert (chunks[2].start_line, chunks[2].end_line) == (5, 7)
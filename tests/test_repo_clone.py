@@ -99,3 +99,22 @@ def test_ensure_repo_cloned_updates_from_feature_branch_to_latest_main(
     assert _run_git(clone_path, "log", "-1", "--oneline")  # has commits
     # Main should have the "main update" commit
     assert "hello updated" in (clone_path / "README.md").read_text()
+
+
+def test_ensure_repos_cloned_isolates_failures(monkeypatch) -> None:
+    """One raising clone (e.g. a hung fetch) must not abort the whole batch."""
+    from ai_army.repo_clone import ensure_repos_cloned
+
+    good = GitHubRepoConfig(token="x", repo="owner/good")
+    bad = GitHubRepoConfig(token="x", repo="owner/bad")
+
+    def fake_clone(cfg: GitHubRepoConfig) -> Path:
+        if cfg.repo == "owner/bad":
+            raise subprocess.TimeoutExpired(cmd=["git", "fetch", "origin"], timeout=60)
+        return Path("/workspace/owner_good")
+
+    monkeypatch.setattr("ai_army.repo_clone.ensure_repo_cloned", fake_clone)
+
+    result = ensure_repos_cloned([good, bad])
+
+    assert result == {"owner/good": Path("/workspace/owner_good"), "owner/bad": None}